@@ -8,31 +8,65 @@ SOLID:
 - OCP: Fácil cambiar implementaciones sin tocar lógica de negocio
 """
 
+import os
+from typing import Iterable, List, Optional
 from flask import Flask, jsonify
 from flask_cors import CORS
 
 # Repositories (Infraestructura)
 from infrastructure.repositories.menu_repository import InMemoryMenuRepository
 from infrastructure.repositories.order_repository import InMemoryOrderRepository
+from infrastructure.cache.derived_prototype_cache import LRUPrototypeCache
+from infrastructure.sharding.consistent_hash import ConsistentHashRing
+from infrastructure.export.order_exporters import available_exporters
+from infrastructure.diagnostics.tracemalloc_profiler import TracemallocProfiler
 
 # Services (Aplicación)
 from application.services.pizza_service import PizzaService
 from application.services.order_service import OrderService
+from application.services.store_service import StoreService
+from application.services.diagnostics_service import MemoryDiagnosticsService
 
 # Use Cases (Aplicación)
 from application.use_cases.create_order import CreateOrderUseCase
+from application.use_cases.export_orders import ExportOrdersUseCase
 
 # Routes (API)
 from api.routes.menu_routes import create_menu_routes
 from api.routes.order_routes import create_order_routes
+from api.routes.store_routes import create_store_routes
+from api.routes.admin_routes import create_admin_routes
 
-def create_app() -> Flask:
+def create_app(
+    workers: Optional[List[str]] = None,
+    worker_id: Optional[str] = None,
+    stores: Iterable[str] = (),
+    admin_token: Optional[str] = None
+) -> Flask:
     """
     Factory de la aplicación Flask.
     Aquí configuramos todas las dependencias (DI Container manual).
+    
+    workers/worker_id: al desplegar varios procesos, cada tienda se
+    asigna a un worker por hashing consistente y este proceso solo
+    atiende las suyas (las demás responden 421 con el worker dueño).
+    stores: tiendas que existen al arrancar (se crean las de este worker);
+    otras se crean con POST /store/<store_id>.
+    admin_token: token para /admin, para exportar pedidos y para crear
+    tiendas o registrar templates (por defecto PIZZERIA_ADMIN_TOKEN; sin
+    token, deshabilitado).
     """
+    if workers and worker_id not in workers:
+        raise ValueError(
+            f"worker_id {worker_id!r} debe ser uno de los workers: {', '.join(workers)}"
+        )
+    
+    admin_token = admin_token or os.environ.get('PIZZERIA_ADMIN_TOKEN')
+    
     app = Flask(__name__)
-    CORS(app)
+    # CORS solo para la API pública: /admin y la exportación de pedidos
+    # (datos de clientes) no se exponen a otros orígenes
+    CORS(app, resources={r'^/(?!admin(/|$)|(store/[^/]+/)?order/export(/|$)).*': {}})
     
     # ============================================
     # DEPENDENCY INJECTION CONTAINER
@@ -40,22 +74,65 @@ def create_app() -> Flask:
     
     # 1. Crear repositorios (capa más baja)
     menu_repo = InMemoryMenuRepository()
-    order_repo = InMemoryOrderRepository()
+    # template_of: lo que se comparte con los templates no cuenta en la
+    # memoria estimada de pedidos y prototipos
+    order_repo = InMemoryOrderRepository(template_of=menu_repo.template_of)
+    
+    # Caché de prototipos derivados, invalidada al reemplazar un template
+    prototype_cache = LRUPrototypeCache(max_size=256, template_of=menu_repo.template_of)
+    menu_repo.subscribe(prototype_cache.invalidate)
     
     # 2. Crear servicios (inyectar repositorios)
-    pizza_service = PizzaService(menu_repo)
+    pizza_service = PizzaService(menu_repo, prototype_cache)
     order_service = OrderService(order_repo)
     
+    # Tiendas: instantánea compartida del menú (los templates se guardan
+    # una vez) y una partición de pedidos por tienda
+    ring = ConsistentHashRing(workers) if workers else None
+    exporters = available_exporters()
+    shared_menu = menu_repo.snapshot()
+    store_service = StoreService(
+        shared_menu=shared_menu,
+        order_repository_factory=lambda: InMemoryOrderRepository(
+            template_of=shared_menu.template_of
+        ),
+        prototype_cache_factory=lambda: LRUPrototypeCache(
+            max_size=256, template_of=shared_menu.template_of
+        ),
+        owner_of=ring.node_for if ring else None,
+        worker_id=worker_id,
+        exporters=exporters,
+        store_ids=stores
+    )
+    
+    # Diagnóstico de memoria: cada componente reporta su estimación
+    diagnostics_service = MemoryDiagnosticsService(
+        components={
+            'orders': order_repo,
+            'menu': menu_repo,
+            'prototype_cache': prototype_cache,
+            'stores': store_service
+        },
+        profiler=TracemallocProfiler()
+    )
+    
     # 3. Crear casos de uso (inyectar servicios)
     create_order_use_case = CreateOrderUseCase(pizza_service, order_service)
+    export_orders_use_case = ExportOrdersUseCase(order_repo, exporters)
     
     # 4. Crear rutas (inyectar casos de uso y servicios)
     menu_bp = create_menu_routes(pizza_service)
-    order_bp = create_order_routes(create_order_use_case, order_service)
+    order_bp = create_order_routes(
+        create_order_use_case, order_service, export_orders_use_case, admin_token
+    )
+    store_bp = create_store_routes(store_service, admin_token)
+    admin_bp = create_admin_routes(diagnostics_service, admin_token)
     
     # 5. Registrar blueprints
     app.register_blueprint(menu_bp)
     app.register_blueprint(order_bp)
+    app.register_blueprint(store_bp)
+    app.register_blueprint(admin_bp)
     
     # ============================================
     # RUTAS GENERALES
@@ -67,8 +144,17 @@ def create_app() -> Flask:
             'message': '🍕 Pizzería API con SOLID',
             'endpoints': {
                 'GET /menu': 'Ver menú',
+                'GET /menu/search': 'Buscar en el menú',
+                'GET /menu/cache': 'Métricas de la caché de prototipos',
                 'POST /order': 'Crear pedido',
-                'GET /order/<id>': 'Ver pedido'
+                'GET /order/<id>': 'Ver pedido',
+                'GET /order/export': 'Exportar pedidos (csv, columnar, parquet, arrow)',
+                'POST /store/<store_id>': 'Crear una tienda',
+                'GET /store/<store_id>/menu': 'Ver menú de una tienda',
+                'PUT /store/<store_id>/menu/templates/<name>': 'Registrar un template en una tienda',
+                'POST /store/<store_id>/order': 'Crear pedido en una tienda',
+                'GET /store/<store_id>/order/<id>': 'Ver pedido de una tienda',
+                'GET /admin/memory': 'Memoria aproximada por componente y entidad (requiere token)'
             }
         })
     
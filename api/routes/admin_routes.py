@@ -0,0 +1,134 @@
+# api/routes/admin_routes.py
+"""
+Rutas de administración (diagnóstico de memoria).
+
+Requieren el token de administración en 'Authorization: Bearer <token>'.
+Sin token configurado la administración queda deshabilitada (403).
+
+SOLID:
+- SRP: Solo maneja endpoints de diagnóstico
+- DIP: Depende del servicio de diagnóstico inyectado
+"""
+
+import hmac
+from typing import Optional
+from flask import Blueprint, request, jsonify
+from application.services.diagnostics_service import MemoryDiagnosticsService
+
+# tracemalloc acepta entre 1 y 65535 frames por traza
+MAX_TRACEMALLOC_FRAMES = 65_535
+
+def check_admin_token(admin_token: Optional[str]):
+    """Respuesta de error si la petición no trae el token de administración"""
+    if not admin_token:
+        return jsonify({
+            'success': False,
+            'error': 'Administración deshabilitada (configurar PIZZERIA_ADMIN_TOKEN)'
+        }), 403
+    scheme, _, token = request.headers.get('Authorization', '').partition(' ')
+    if scheme.lower() != 'bearer' or not hmac.compare_digest(
+        token.strip().encode(), admin_token.encode()
+    ):
+        return jsonify({
+            'success': False,
+            'error': 'Token de administración no válido'
+        }), 401
+    return None
+
+
+def create_admin_routes(
+    diagnostics_service: MemoryDiagnosticsService,
+    admin_token: Optional[str] = None
+) -> Blueprint:
+    """Factory de rutas de administración"""
+    
+    admin_bp = Blueprint('admin', __name__, url_prefix='/admin')
+    
+    @admin_bp.before_request
+    def require_admin():
+        return check_admin_token(admin_token)
+    
+    @admin_bp.route('/memory', methods=['GET'])
+    def get_memory():
+        """GET /admin/memory - Memoria aproximada por componente y entidad"""
+        try:
+            return jsonify({
+                'success': True,
+                'memory': diagnostics_service.get_report()
+            }), 200
+        except Exception as e:
+            return jsonify({
+                'success': False,
+                'error': str(e)
+            }), 500
+    
+    @admin_bp.route('/memory/tracemalloc', methods=['POST'])
+    def start_tracemalloc():
+        """POST /admin/memory/tracemalloc - Activar tracemalloc (parámetro: frames)"""
+        frames = request.args.get('frames', type=int)
+        if 'frames' not in request.args:
+            frames = 1
+        if frames is None or not 1 <= frames <= MAX_TRACEMALLOC_FRAMES:
+            return jsonify({
+                'success': False,
+                'error': f'frames debe ser un entero entre 1 y {MAX_TRACEMALLOC_FRAMES}'
+            }), 400
+        try:
+            diagnostics_service.start_profiling(frames)
+        except RuntimeError as e:
+            return jsonify({
+                'success': False,
+                'error': str(e)
+            }), 404
+        return jsonify({
+            'success': True,
+            'tracing': True
+        }), 200
+    
+    @admin_bp.route('/memory/tracemalloc', methods=['GET'])
+    def get_tracemalloc_diff():
+        """
+        GET /admin/memory/tracemalloc - Diff por módulo desde la consulta
+        anterior (parámetro: limit)
+        """
+        limit = request.args.get('limit', type=int)
+        if 'limit' not in request.args:
+            limit = 20
+        if limit is None or limit < 1:
+            return jsonify({
+                'success': False,
+                'error': 'limit debe ser un entero mayor que 0'
+            }), 400
+        try:
+            diff = diagnostics_service.get_profile_diff(limit)
+        except RuntimeError as e:
+            return jsonify({
+                'success': False,
+                'error': str(e)
+            }), 404
+        if not diff['tracing']:
+            return jsonify({
+                'success': False,
+                'error': 'tracemalloc no está activo (POST /admin/memory/tracemalloc)'
+            }), 409
+        return jsonify({
+            'success': True,
+            'tracemalloc': diff
+        }), 200
+    
+    @admin_bp.route('/memory/tracemalloc', methods=['DELETE'])
+    def stop_tracemalloc():
+        """DELETE /admin/memory/tracemalloc - Desactivar tracemalloc"""
+        try:
+            diagnostics_service.stop_profiling()
+        except RuntimeError as e:
+            return jsonify({
+                'success': False,
+                'error': str(e)
+            }), 404
+        return jsonify({
+            'success': True,
+            'tracing': False
+        }), 200
+    
+    return admin_bp
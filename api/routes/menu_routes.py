@@ -7,28 +7,137 @@ SOLID:
 - DIP: Depende de servicios inyectados
 """
 
-from flask import Blueprint, jsonify
+import math
+from typing import Callable, List
+from flask import Blueprint, jsonify, request
 from application.services.pizza_service import PizzaService
+from domain.exceptions import InvalidQueryException
 
 def create_menu_routes(pizza_service: PizzaService) -> Blueprint:
     """Factory de rutas del menú"""
+    return menu_blueprint(lambda: pizza_service)
+
+
+def menu_blueprint(get_pizza_service: Callable[[], PizzaService]) -> Blueprint:
+    """
+    Rutas del menú resolviendo el servicio en cada petición
+    (permite montarlas por tienda en /store/<store_id>/menu)
+    """
     
     menu_bp = Blueprint('menu', __name__, url_prefix='/menu')
     
     @menu_bp.route('/', methods=['GET'])
     def get_menu():
-        """GET /menu - Obtener menú completo"""
+        """
+        GET /menu - Obtener menú
+
+        Parámetros opcionales: fields (lista separada por coma),
+        limit y cursor (paginación)
+        """
         try:
-            menu = pizza_service.get_menu()
+            limit = request.args.get('limit', type=int)
+            if 'limit' in request.args and limit is None:
+                return jsonify({
+                    'success': False,
+                    'error': 'limit debe ser un entero'
+                }), 400
+            
+            page = get_pizza_service().get_menu_page(
+                fields=_parse_list('fields'),
+                limit=limit,
+                cursor=request.args.get('cursor')
+            )
             return jsonify({
                 'success': True,
-                'menu': menu,
-                'total': len(menu)
+                **page
             }), 200
+        except InvalidQueryException as e:
+            return jsonify({
+                'success': False,
+                'error': str(e)
+            }), 400
         except Exception as e:
             return jsonify({
                 'success': False,
                 'error': str(e)
             }), 500
     
-    return menu_bp
\ No newline at end of file
+    @menu_bp.route('/search', methods=['GET'])
+    def search_menu():
+        """
+        GET /menu/search - Buscar en el menú
+
+        Parámetros: with, without (listas separadas por coma),
+        max_price, max_cooking_time, q (tokens del nombre) y, como en
+        GET /menu, fields, limit y cursor
+        """
+        try:
+            limit = request.args.get('limit', type=int)
+            if 'limit' in request.args and limit is None:
+                return jsonify({
+                    'success': False,
+                    'error': 'limit debe ser un entero'
+                }), 400
+            max_price = request.args.get('max_price', type=float)
+            max_cooking_time = request.args.get('max_cooking_time', type=int)
+            if 'max_price' in request.args and (
+                max_price is None or not math.isfinite(max_price)
+            ):
+                return jsonify({
+                    'success': False,
+                    'error': 'max_price debe ser un número finito'
+                }), 400
+            if 'max_cooking_time' in request.args and max_cooking_time is None:
+                return jsonify({
+                    'success': False,
+                    'error': 'max_cooking_time debe ser un entero'
+                }), 400
+            
+            page = get_pizza_service().search_menu(
+                with_ingredients=_parse_list('with'),
+                without_ingredients=_parse_list('without'),
+                max_price=max_price,
+                max_cooking_time=max_cooking_time,
+                query=request.args.get('q'),
+                fields=_parse_list('fields'),
+                limit=limit,
+                cursor=request.args.get('cursor')
+            )
+            return jsonify({
+                'success': True,
+                **page
+            }), 200
+        except InvalidQueryException as e:
+            return jsonify({
+                'success': False,
+                'error': str(e)
+            }), 400
+        except Exception as e:
+            return jsonify({
+                'success': False,
+                'error': str(e)
+            }), 500
+    
+    @menu_bp.route('/cache', methods=['GET'])
+    def get_cache_stats():
+        """GET /menu/cache - Métricas de la caché de prototipos derivados"""
+        stats = get_pizza_service().get_cache_stats()
+        if stats is None:
+            return jsonify({
+                'success': False,
+                'error': 'Caché de prototipos no configurada'
+            }), 404
+        return jsonify({
+            'success': True,
+            'cache': stats
+        }), 200
+    
+    return menu_bp
+
+
+def _parse_list(param: str) -> List[str]:
+    """Leer un parámetro de lista (repetido y/o separado por comas)"""
+    values = []
+    for raw in request.args.getlist(param):
+        values.extend(item for item in raw.split(',') if item.strip())
+    return values
\ No newline at end of file
@@ -7,19 +7,88 @@ SOLID:
 - DIP: Depende de casos de uso inyectados
 """
 
-from flask import Blueprint, request, jsonify
+from typing import Callable, Optional
+from flask import Blueprint, Response, request, jsonify
 from application.use_cases.create_order import CreateOrderUseCase
+from application.use_cases.export_orders import ExportOrdersUseCase
 from application.services.order_service import OrderService
-from domain.exceptions import PizzaNotFoundException
+from domain.exceptions import (
+    PizzaNotFoundException,
+    InvalidQueryException,
+    UnsupportedExportFormatException
+)
+from api.routes.admin_routes import check_admin_token
 
 def create_order_routes(
     create_order_use_case: CreateOrderUseCase,
-    order_service: OrderService
+    order_service: OrderService,
+    export_orders_use_case: Optional[ExportOrdersUseCase] = None,
+    admin_token: Optional[str] = None
 ) -> Blueprint:
     """Factory de rutas de pedidos"""
+    return order_blueprint(
+        lambda: create_order_use_case,
+        lambda: order_service,
+        (lambda: export_orders_use_case) if export_orders_use_case else None,
+        admin_token
+    )
+
+
+def order_blueprint(
+    get_create_order_use_case: Callable[[], CreateOrderUseCase],
+    get_order_service: Callable[[], OrderService],
+    get_export_orders_use_case: Optional[Callable[[], ExportOrdersUseCase]] = None,
+    admin_token: Optional[str] = None
+) -> Blueprint:
+    """
+    Rutas de pedidos resolviendo los servicios en cada petición
+    (permite montarlas por tienda en /store/<store_id>/order).
+    La exportación incluye datos de clientes: requiere admin_token.
+    """
     
     order_bp = Blueprint('orders', __name__, url_prefix='/order')
     
+    if get_export_orders_use_case is not None:
+        @order_bp.route('/export', methods=['GET'])
+        def export_orders():
+            """
+            GET /order/export - Exportar pedidos en streaming
+
+            Parámetros: format (csv, columnar, parquet, arrow) y
+            row_group_size (filas por grupo, hasta 1048576).
+            Requiere el token de administración.
+            """
+            denied = check_admin_token(admin_token)
+            if denied is not None:
+                return denied
+            file_format = request.args.get('format', 'csv')
+            row_group_size = request.args.get('row_group_size', type=int)
+            if 'row_group_size' not in request.args:
+                row_group_size = 65_536
+            elif row_group_size is None:
+                return jsonify({
+                    'success': False,
+                    'error': 'row_group_size debe ser un entero'
+                }), 400
+            try:
+                export_use_case = get_export_orders_use_case()
+                exporter = export_use_case.exporter_for(file_format)
+                chunks = export_use_case.stream(file_format, row_group_size)
+            except (UnsupportedExportFormatException, InvalidQueryException) as e:
+                return jsonify({
+                    'success': False,
+                    'error': str(e)
+                }), 400
+            
+            return Response(
+                chunks,
+                mimetype=exporter.content_type,
+                headers={
+                    'Content-Disposition':
+                        f'attachment; filename=pedidos.{exporter.extension}'
+                }
+            )
+    
     @order_bp.route('/', methods=['POST'])
     def create_order():
         """POST /order - Crear pedido"""
@@ -39,12 +108,35 @@ def create_order_routes(
                     'error': 'Nombre del cliente es requerido'
                 }), 400
             
+            if not isinstance(data['pizza'], str) or not isinstance(data['customer_name'], str):
+                return jsonify({
+                    'success': False,
+                    'error': 'pizza y customer_name deben ser textos'
+                }), 400
+            
+            size = data.get('size')
+            if size is not None and not isinstance(size, str):
+                return jsonify({
+                    'success': False,
+                    'error': 'size debe ser un texto'
+                }), 400
+            
+            extra_toppings = data.get('extra_toppings')
+            if extra_toppings is not None and not (
+                isinstance(extra_toppings, list)
+                and all(isinstance(topping, str) for topping in extra_toppings)
+            ):
+                return jsonify({
+                    'success': False,
+                    'error': 'extra_toppings debe ser una lista de textos'
+                }), 400
+            
             # Ejecutar caso de uso
-            result = create_order_use_case.execute(
+            result = get_create_order_use_case().execute(
                 pizza_name=data['pizza'],
                 customer_name=data['customer_name'],
-                size=data.get('size'),
-                extra_toppings=data.get('extra_toppings')
+                size=size,
+                extra_toppings=extra_toppings
             )
             
             return jsonify(result), 201
@@ -64,6 +156,7 @@ def create_order_routes(
     def get_order(order_id: str):
         """GET /order/<id> - Obtener pedido"""
         try:
+            order_service = get_order_service()
             order = order_service.get_order(order_id)
             return jsonify({
                 'success': True,
@@ -0,0 +1,167 @@
+# api/routes/store_routes.py
+"""
+Rutas por tienda.
+
+Monta las rutas del menú y de pedidos bajo /store/<store_id>, resolviendo
+en cada petición los servicios de la tienda. Las tiendas se crean con
+POST /store/<store_id>; las lecturas de tiendas desconocidas dan 404.
+Crear tiendas, registrar templates y exportar pedidos requiere el token
+de administración.
+
+SOLID:
+- SRP: Solo resuelve la tienda y delega en las rutas existentes
+- DIP: Depende del servicio de tiendas inyectado
+"""
+
+import math
+from datetime import datetime
+from typing import Any, Dict, Optional
+from flask import Blueprint, g, jsonify, request
+from application.services.store_service import StoreService
+from domain.entities import Pizza
+from domain.exceptions import (
+    StoreLimitException,
+    StoreNotFoundException,
+    StoreNotOwnedException
+)
+from api.routes.menu_routes import menu_blueprint
+from api.routes.order_routes import order_blueprint
+from api.routes.admin_routes import check_admin_token
+
+# Endpoints que modifican tiendas (requieren el token de administración)
+_ADMIN_ENDPOINTS = ('store.create_store', 'store.register_template')
+
+def create_store_routes(
+    store_service: StoreService,
+    admin_token: Optional[str] = None
+) -> Blueprint:
+    """Factory de rutas por tienda"""
+    
+    store_bp = Blueprint('store', __name__, url_prefix='/store/<store_id>')
+    
+    @store_bp.url_value_preprocessor
+    def pull_store_id(endpoint, values):
+        g.store_id = values.pop('store_id')
+    
+    @store_bp.before_request
+    def load_store():
+        """Resolver la tienda (o indicar qué worker la atiende)"""
+        if request.endpoint in _ADMIN_ENDPOINTS:
+            denied = check_admin_token(admin_token)
+            if denied is not None:
+                return denied
+        if request.endpoint == 'store.create_store':
+            return None
+        try:
+            g.store = store_service.get(g.store_id)
+        except StoreNotOwnedException as e:
+            return _not_owned(e)
+        except StoreNotFoundException as e:
+            return jsonify({
+                'success': False,
+                'error': str(e)
+            }), 404
+    
+    @store_bp.route('', methods=['POST'])
+    def create_store():
+        """POST /store/<store_id> - Crear una tienda"""
+        existed = store_service.exists(g.store_id)
+        try:
+            store_service.create(g.store_id)
+        except StoreNotOwnedException as e:
+            return _not_owned(e)
+        except StoreNotFoundException as e:
+            return jsonify({
+                'success': False,
+                'error': str(e)
+            }), 400
+        except StoreLimitException as e:
+            return jsonify({
+                'success': False,
+                'error': str(e)
+            }), 409
+        return jsonify({
+            'success': True,
+            'store': g.store_id
+        }), 200 if existed else 201
+    
+    @store_bp.route('/menu/templates/<name>', methods=['PUT'])
+    def register_template(name: str):
+        """
+        PUT /store/<store_id>/menu/templates/<name> - Registrar (o
+        reemplazar) un template solo en esta tienda
+        """
+        data = request.get_json(silent=True)
+        if not isinstance(data, dict):
+            return jsonify({
+                'success': False,
+                'error': 'Se espera un objeto JSON'
+            }), 400
+        try:
+            pizza = _pizza_from_json(data)
+        except ValueError as e:
+            return jsonify({
+                'success': False,
+                'error': str(e)
+            }), 400
+        
+        store_service.register_template(g.store_id, name, pizza)
+        return jsonify({
+            'success': True,
+            'store': g.store_id,
+            'template': name.lower()
+        }), 200
+    
+    store_bp.register_blueprint(menu_blueprint(lambda: g.store.pizza_service))
+    store_bp.register_blueprint(order_blueprint(
+        lambda: g.store.create_order_use_case,
+        lambda: g.store.order_service,
+        lambda: g.store.export_orders_use_case,
+        admin_token
+    ))
+    
+    return store_bp
+
+
+def _not_owned(error: StoreNotOwnedException):
+    return jsonify({
+        'success': False,
+        'error': str(error),
+        'worker': error.owner
+    }), 421
+
+
+def _pizza_from_json(data: Dict[str, Any]) -> Pizza:
+    """Construir un template a partir del cuerpo de la petición"""
+    for field in ('name', 'size', 'base', 'sauce', 'cheese'):
+        if field in data and not isinstance(data[field], str):
+            raise ValueError(f"{field} debe ser un texto")
+    if not data.get('name'):
+        raise ValueError("name es requerido")
+    
+    toppings = data.get('toppings', [])
+    if not isinstance(toppings, list) or not all(isinstance(t, str) for t in toppings):
+        raise ValueError("toppings debe ser una lista de textos")
+    
+    price = data.get('price')
+    if isinstance(price, bool) or not isinstance(price, (int, float)) \
+            or not math.isfinite(price) or price < 0:
+        raise ValueError("price debe ser un número mayor o igual que 0")
+    
+    cooking_time = data.get('cooking_time')
+    if isinstance(cooking_time, bool) or not isinstance(cooking_time, int) \
+            or cooking_time <= 0:
+        raise ValueError("cooking_time debe ser un entero mayor que 0")
+    
+    return Pizza(
+        id="",
+        name=data['name'],
+        size=data.get('size', 'medium'),
+        base=data.get('base', 'masa tradicional'),
+        sauce=data.get('sauce', 'tomate'),
+        cheese=data.get('cheese', 'mozzarella'),
+        toppings=list(toppings),
+        price=float(price),
+        cooking_time=cooking_time,
+        created_at=datetime.now()
+    )
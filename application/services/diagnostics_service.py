@@ -0,0 +1,110 @@
+# application/services/diagnostics_service.py
+"""
+Servicio de diagnóstico de memoria.
+
+Junta la memoria aproximada que reporta cada componente (repositorios y
+cachés) y el perfilado bajo demanda con tracemalloc. Los componentes
+estiman al escribir, así que generar el reporte no recorre el heap y se
+puede consultar cada minuto.
+
+SOLID:
+- SRP: Solo agrega métricas de memoria
+- DIP: Depende de las interfaces MemoryAccountable y MemoryProfiler
+"""
+
+import os
+import sys
+from typing import Any, Dict, Iterable, Optional
+from domain.interfaces import MemoryAccountable, MemoryProfiler
+
+try:
+    import resource
+except ImportError:  # pragma: no cover - no existe en Windows
+    resource = None
+
+def combine_usage(usages: Iterable[Dict[str, Any]]) -> Dict[str, Any]:
+    """Sumar reportes de memoria (los promedios se ponderan por muestras)"""
+    entries = 0
+    approx_bytes = 0
+    entity_totals: Dict[str, Dict[str, float]] = {}
+    for usage in usages:
+        entries += usage.get('entries', 0)
+        approx_bytes += usage.get('approx_bytes', 0)
+        for name, entity in usage.get('entities', {}).items():
+            total = entity_totals.setdefault(name, {'bytes': 0.0, 'samples': 0})
+            total['bytes'] += entity['avg_bytes'] * entity['samples']
+            total['samples'] += entity['samples']
+    return {
+        'entries': entries,
+        'approx_bytes': approx_bytes,
+        'entities': {
+            name: {
+                'avg_bytes': round(total['bytes'] / total['samples'], 1) if total['samples'] else 0.0,
+                'samples': int(total['samples'])
+            }
+            for name, total in entity_totals.items()
+        }
+    }
+
+
+def _process_memory() -> Dict[str, Optional[int]]:
+    """RSS actual (Linux) y pico del proceso, sin recorrer el heap"""
+    rss = None
+    try:
+        with open('/proc/self/statm') as f:
+            rss = int(f.read().split()[1]) * os.sysconf('SC_PAGE_SIZE')
+    except (OSError, ValueError, IndexError, AttributeError):
+        pass
+    
+    peak = None
+    if resource is not None:
+        peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+        if sys.platform != 'darwin':
+            peak *= 1024  # En Linux ru_maxrss está en KiB
+    return {'rss_bytes': rss, 'peak_rss_bytes': peak}
+
+
+class MemoryDiagnosticsService:
+    """Servicio para reportar la memoria por componente y por entidad"""
+    
+    def __init__(
+        self,
+        components: Dict[str, MemoryAccountable],
+        profiler: Optional[MemoryProfiler] = None
+    ):
+        """Inyección de dependencias"""
+        self._components = components
+        self._profiler = profiler
+    
+    def get_report(self) -> Dict[str, Any]:
+        """Memoria aproximada por componente y tamaño promedio por entidad"""
+        components = {
+            name: component.memory_usage()
+            for name, component in self._components.items()
+        }
+        combined = combine_usage(components.values())
+        return {
+            'process': _process_memory(),
+            'approx_bytes': combined['approx_bytes'],
+            'components': components,
+            'entities': combined['entities'],
+            'tracemalloc': {
+                'available': self._profiler is not None,
+                'tracing': self._profiler is not None and self._profiler.is_tracing()
+            }
+        }
+    
+    def start_profiling(self, frames: int = 1) -> None:
+        self._require_profiler().start(frames)
+    
+    def stop_profiling(self) -> None:
+        self._require_profiler().stop()
+    
+    def get_profile_diff(self, limit: int = 20) -> Dict[str, Any]:
+        """Diff de tracemalloc por módulo desde la consulta anterior"""
+        return self._require_profiler().diff(limit)
+    
+    def _require_profiler(self) -> MemoryProfiler:
+        if self._profiler is None:
+            raise RuntimeError("Perfilador de memoria no configurado")
+        return self._profiler
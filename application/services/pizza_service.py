@@ -7,31 +7,130 @@ SOLID:
 - DIP: Depende de interfaces, no de implementaciones
 """
 
-from typing import List, Dict, Any
-from domain.interfaces import MenuRepository
-from domain.entities import Pizza
+from dataclasses import replace
+from typing import List, Dict, Any, Optional, Tuple
+from domain.interfaces import MenuRepository, PrototypeCache
+from domain.entities import Pizza, PizzaView
+from domain.exceptions import InvalidQueryException
+
+# Campos que expone el menú por defecto y campos proyectables
+MENU_FIELDS = ('id', 'name', 'size', 'toppings', 'price', 'cooking_time')
+VIEW_FIELDS = MENU_FIELDS + ('base', 'sauce', 'cheese')
 
 class PizzaService:
     """Servicio para operaciones con pizzas"""
     
-    def __init__(self, menu_repository: MenuRepository):
+    def __init__(
+        self,
+        menu_repository: MenuRepository,
+        prototype_cache: Optional[PrototypeCache] = None
+    ):
         """
         Inyección de dependencias (DIP)
         
         No dependemos de InMemoryMenuRepository específicamente,
-        sino de la interfaz MenuRepository
+        sino de la interfaz MenuRepository. La caché de prototipos
+        derivados es opcional.
         """
         self._menu_repo = menu_repository
+        self._prototype_cache = prototype_cache
     
     def get_menu(self) -> List[Dict[str, Any]]:
-        """Obtener menú completo"""
-        pizzas = self._menu_repo.list_all()
-        return [self._pizza_to_dict(pizza) for pizza in pizzas]
+        """Obtener menú completo (vistas de solo lectura, sin clonar)"""
+        views = self._menu_repo.list_views()
+        return [self._view_to_dict(view, MENU_FIELDS) for view in views]
+    
+    def get_menu_page(
+        self,
+        fields: Optional[List[str]] = None,
+        limit: Optional[int] = None,
+        cursor: Optional[str] = None
+    ) -> Dict[str, Any]:
+        """
+        Obtener una página del menú con proyección de campos.
+        
+        El cursor es la posición (opaca para el cliente) donde empieza
+        la página; 'next_cursor' es None cuando no hay más páginas.
+        """
+        selected = self._parse_fields(fields)
+        offset = self._parse_page(limit, cursor)
+        
+        views = self._menu_repo.list_views(offset=offset, limit=limit)
+        return self._page(views, offset, self._menu_repo.count(), selected)
+    
+    def search_menu(
+        self,
+        with_ingredients: Optional[List[str]] = None,
+        without_ingredients: Optional[List[str]] = None,
+        max_price: Optional[float] = None,
+        max_cooking_time: Optional[int] = None,
+        query: Optional[str] = None,
+        fields: Optional[List[str]] = None,
+        limit: Optional[int] = None,
+        cursor: Optional[str] = None
+    ) -> Dict[str, Any]:
+        """
+        Buscar pizzas en el menú por ingredientes, precio, tiempo o nombre.
+        Retorna una página con el mismo formato que get_menu_page.
+        """
+        selected = self._parse_fields(fields)
+        offset = self._parse_page(limit, cursor)
+        
+        views = self._menu_repo.search(
+            with_ingredients=with_ingredients or [],
+            without_ingredients=without_ingredients or [],
+            max_price=max_price,
+            max_cooking_time=max_cooking_time,
+            query=query
+        )
+        end = None if limit is None else offset + limit
+        return self._page(views[offset:end], offset, len(views), selected)
     
     def get_pizza(self, name: str) -> Pizza:
         """Obtener una pizza específica (copia del prototipo)"""
         return self._menu_repo.get(name)
     
+    def get_customized_pizza(
+        self,
+        name: str,
+        size: Optional[str] = None,
+        extra_toppings: Optional[List[str]] = None
+    ) -> Pizza:
+        """
+        Obtener una pizza personalizada.
+        
+        Las configuraciones repetidas se copian desde un prototipo derivado
+        en caché, en lugar de clonar el template y volver a aplicar el
+        tamaño y cada ingrediente.
+        """
+        if not size and not extra_toppings:
+            return self.get_pizza(name)
+        
+        if self._prototype_cache is None:
+            return self._build_customized(name, size, extra_toppings)
+        
+        key = (name.lower(), size or None, tuple(extra_toppings or ()))
+        prototype = self._prototype_cache.get(key)
+        if prototype is not None:
+            return self._copy_derived(prototype)
+        
+        # La generación se lee antes que el template: si un register lo
+        # reemplaza mientras tanto, la caché rechaza este prototipo
+        generation = self._prototype_cache.generation(key[0])
+        pizza = self._build_customized(name, size, extra_toppings)
+        self._prototype_cache.put(key, self._copy_derived(pizza), generation)
+        return pizza
+    
+    def register_template(self, name: str, pizza: Pizza) -> None:
+        """Registrar (o reemplazar) un template en el menú"""
+        self._menu_repo.register(name, pizza)
+    
+    def get_cache_stats(self) -> Optional[Dict[str, Any]]:
+        """Métricas de la caché de prototipos derivados (None si no hay)"""
+        if self._prototype_cache is None:
+            return None
+        return self._prototype_cache.stats()
+    
     def customize_pizza(
         self,
         pizza: Pizza,
@@ -50,6 +149,30 @@ class PizzaService:
 
         return pizza
     
+    def _build_customized(
+        self,
+        name: str,
+        size: Optional[str],
+        extra_toppings: Optional[List[str]]
+    ) -> Pizza:
+        """Clonar el template y aplicar tamaño e ingredientes extra"""
+        pizza = self.get_pizza(name)
+        return self.customize_pizza(
+            pizza=pizza,
+            size=size if size else pizza.size,
+            extra_toppings=extra_toppings if extra_toppings else []
+        )
+    
+    def _copy_derived(self, prototype: Pizza) -> Pizza:
+        """
+        Copiar un prototipo derivado con un nuevo ID. Todos los campos
+        son inmutables salvo toppings, así que basta copiar esa lista
+        (mucho más barato que el deepcopy de Pizza.clone).
+        """
+        return replace(
+            prototype, id='', created_at=None, toppings=list(prototype.toppings)
+        )
+    
     def _adjust_size(self, pizza: Pizza, size: str) -> None:
         """Ajustar tamaño y precio"""
         pizza.size = size
@@ -58,6 +181,47 @@ class PizzaService:
         elif size == "small":
             pizza.price *= 0.75
     
+    def _parse_fields(self, fields: Optional[List[str]]) -> Tuple[str, ...]:
+        """Validar los campos pedidos (por defecto, los del menú)"""
+        if not fields:
+            return MENU_FIELDS
+        unknown = [field for field in fields if field not in VIEW_FIELDS]
+        if unknown:
+            raise InvalidQueryException(
+                f"Campos no válidos: {', '.join(unknown)}"
+            )
+        return tuple(fields)
+    
+    def _parse_page(self, limit: Optional[int], cursor: Optional[str]) -> int:
+        """Validar limit y cursor; retorna la posición donde empieza la página"""
+        if limit is not None and limit <= 0:
+            raise InvalidQueryException("limit debe ser mayor que 0")
+        if not cursor:
+            return 0
+        # isdigit() también acepta dígitos Unicode como '²', que int() rechaza
+        if not (cursor.isascii() and cursor.isdigit()):
+            raise InvalidQueryException(f"Cursor '{cursor}' no válido")
+        return int(cursor)
+    
+    def _page(
+        self,
+        views: List[PizzaView],
+        offset: int,
+        total: int,
+        fields: Tuple[str, ...]
+    ) -> Dict[str, Any]:
+        """Página de vistas proyectadas con el cursor de la siguiente"""
+        next_offset = offset + len(views)
+        return {
+            'menu': [self._view_to_dict(view, fields) for view in views],
+            'total': total,
+            'next_cursor': str(next_offset) if views and next_offset < total else None
+        }
+    
+    def _view_to_dict(self, view: PizzaView, fields: Tuple[str, ...]) -> Dict[str, Any]:
+        """Proyectar una vista a diccionario con los campos pedidos"""
+        return {field: getattr(view, field) for field in fields}
+    
     def _pizza_to_dict(self, pizza: Pizza) -> Dict[str, Any]:
         """Convertir pizza a diccionario"""
         return {
@@ -0,0 +1,197 @@
+# application/services/store_service.py
+"""
+Servicio de tiendas (multi-tienda).
+
+Las tiendas existen porque se configuran al arrancar o se crean de forma
+explícita (create); una lectura de una tienda desconocida no la crea.
+Cada tienda tiene su propia partición de pedidos y su propia instantánea
+del menú. Las tiendas sin templates propios comparten una única
+instantánea (y su caché de prototipos derivados); al registrar un
+template propio, la tienda obtiene una capa sobre esa instantánea que
+solo guarda sus propios templates e índice (copy-on-write).
+
+SOLID:
+- SRP: Solo resuelve y crea los servicios de cada tienda
+- DIP: Recibe fábricas de repositorios y cachés, no implementaciones
+"""
+
+import re
+import threading
+from dataclasses import dataclass
+from typing import Any, Callable, Dict, Iterable, Iterator, List, Optional
+from domain.interfaces import (
+    MemoryAccountable,
+    MenuRepository,
+    OrderRepository,
+    OrderExporter,
+    PrototypeCache
+)
+from domain.entities import Pizza
+from domain.exceptions import (
+    StoreLimitException,
+    StoreNotFoundException,
+    StoreNotOwnedException
+)
+from application.services.pizza_service import PizzaService
+from application.services.order_service import OrderService
+from application.use_cases.create_order import CreateOrderUseCase
+from application.use_cases.export_orders import ExportOrdersUseCase
+from application.services.diagnostics_service import combine_usage
+
+_STORE_ID_RE = re.compile(r"^[A-Za-z0-9_-]{1,64}$")
+
+
+@dataclass
+class StoreContext:
+    """Servicios de una tienda"""
+    store_id: str
+    pizza_service: PizzaService
+    order_service: OrderService
+    create_order_use_case: CreateOrderUseCase
+    order_repository: Optional[OrderRepository] = None
+    export_orders_use_case: Optional[ExportOrdersUseCase] = None
+    has_own_menu: bool = False
+
+
+class StoreService(MemoryAccountable):
+    """Servicio para crear y resolver los servicios de cada tienda"""
+    
+    def __init__(
+        self,
+        shared_menu: MenuRepository,
+        order_repository_factory: Callable[[], OrderRepository],
+        prototype_cache_factory: Optional[Callable[[], PrototypeCache]] = None,
+        owner_of: Optional[Callable[[str], str]] = None,
+        worker_id: Optional[str] = None,
+        max_stores: int = 10_000,
+        exporters: Optional[Dict[str, OrderExporter]] = None,
+        store_ids: Iterable[str] = ()
+    ):
+        """
+        Inyección de dependencias
+        
+        owner_of/worker_id: si se indican, solo se atienden las tiendas
+        cuyo dueño (p. ej. por hashing consistente) es este worker.
+        store_ids: tiendas configuradas; se crean las de este worker.
+        """
+        self._shared_menu = shared_menu
+        self._order_repository_factory = order_repository_factory
+        self._prototype_cache_factory = prototype_cache_factory
+        self._owner_of = owner_of
+        self._worker_id = worker_id
+        self._max_stores = max_stores
+        self._exporters = exporters
+        # Menús y cachés creados (para el reporte de memoria)
+        self._menus: List[MenuRepository] = []
+        self._caches: List[PrototypeCache] = []
+        self._shared_pizza_service = self._build_pizza_service(shared_menu)
+        self._stores: Dict[str, StoreContext] = {}
+        self._lock = threading.Lock()
+        for store_id in store_ids:
+            if self.owner_of(store_id) in (None, self._worker_id):
+                self.create(store_id)
+    
+    def get(self, store_id: str) -> StoreContext:
+        """Obtener los servicios de una tienda existente"""
+        store = self._stores.get(store_id)
+        if store is not None:
+            return store
+        
+        self._check_store(store_id)
+        raise StoreNotFoundException(f"Tienda '{store_id}' no encontrada")
+    
+    def exists(self, store_id: str) -> bool:
+        """¿Existe la tienda en este proceso?"""
+        return store_id in self._stores
+    
+    def create(self, store_id: str) -> StoreContext:
+        """Crear una tienda (si ya existe, retorna la existente)"""
+        self._check_store(store_id)
+        with self._lock:
+            store = self._stores.get(store_id)
+            if store is None:
+                if len(self._stores) >= self._max_stores:
+                    raise StoreLimitException(
+                        f"Límite de {self._max_stores} tiendas alcanzado"
+                    )
+                order_repo = self._order_repository_factory()
+                order_service = OrderService(order_repo)
+                store = StoreContext(
+                    store_id=store_id,
+                    pizza_service=self._shared_pizza_service,
+                    order_service=order_service,
+                    create_order_use_case=CreateOrderUseCase(
+                        self._shared_pizza_service, order_service
+                    ),
+                    order_repository=order_repo,
+                    export_orders_use_case=(
+                        ExportOrdersUseCase(order_repo, self._exporters)
+                        if self._exporters else None
+                    )
+                )
+                self._stores[store_id] = store
+            return store
+    
+    def register_template(self, store_id: str, name: str, pizza: Pizza) -> None:
+        """Registrar un template solo para una tienda"""
+        store = self.get(store_id)
+        with self._lock:
+            if not store.has_own_menu:
+                # Copy-on-write: la tienda deja de compartir la instantánea
+                pizza_service = self._build_pizza_service(self._shared_menu.snapshot())
+                store.pizza_service = pizza_service
+                store.create_order_use_case = CreateOrderUseCase(
+                    pizza_service, store.order_service
+                )
+                store.has_own_menu = True
+            store.pizza_service.register_template(name, pizza)
+    
+    def owner_of(self, store_id: str) -> Optional[str]:
+        """Worker dueño de una tienda (None si no hay reparto)"""
+        if self._owner_of is None:
+            return None
+        return self._owner_of(store_id)
+    
+    def store_count(self) -> int:
+        """Cantidad de tiendas activas en este proceso"""
+        return len(self._stores)
+    
+    def memory_usage(self) -> Dict[str, Any]:
+        """Memoria aproximada de pedidos, menús y cachés de todas las tiendas"""
+        orders = combine_usage(_usages(
+            store.order_repository for store in list(self._stores.values())
+        ))
+        menus = combine_usage(_usages(list(self._menus)))
+        caches = combine_usage(_usages(list(self._caches)))
+        combined = combine_usage([orders, menus, caches])
+        return {
+            'entries': len(self._stores),
+            'approx_bytes': combined['approx_bytes'],
+            'orders': orders,
+            'menus': dict(menus, snapshots=len(self._menus)),
+            'prototype_caches': dict(caches, caches=len(self._caches)),
+            'entities': combined['entities']
+        }
+    
+    def _check_store(self, store_id: str) -> None:
+        if not _STORE_ID_RE.match(store_id):
+            raise StoreNotFoundException(f"Tienda '{store_id}' no válida")
+        owner = self.owner_of(store_id)
+        if owner is not None and owner != self._worker_id:
+            raise StoreNotOwnedException(store_id, owner)
+    
+    def _build_pizza_service(self, menu: MenuRepository) -> PizzaService:
+        self._menus.append(menu)
+        cache = None
+        if self._prototype_cache_factory is not None:
+            cache = self._prototype_cache_factory()
+            menu.subscribe(cache.invalidate)
+            self._caches.append(cache)
+        return PizzaService(menu, cache)
+
+
+def _usages(components: Iterable[Any]) -> Iterator[Dict[str, Any]]:
+    """Reportes de los componentes que informan su memoria"""
+    for component in components:
+        if isinstance(component, MemoryAccountable):
+            yield component.memory_usage()
@@ -39,16 +39,13 @@ class CreateOrderUseCase:
         3. Crear el pedido
         4. Retornar resultado
         """
-        # 1. Obtener pizza (Prototype Pattern en acción)
-        pizza = self._pizza_service.get_pizza(pizza_name)
-
-        # 2. Personalizar
-        if size or extra_toppings:
-            pizza = self._pizza_service.customize_pizza(
-                pizza=pizza,
-                size=size if size else pizza.size,
-                extra_toppings=extra_toppings if extra_toppings else []
-            )
+        # 1 y 2. Obtener pizza personalizada (Prototype Pattern en acción:
+        # clona el template o un prototipo derivado ya personalizado)
+        pizza = self._pizza_service.get_customized_pizza(
+            name=pizza_name,
+            size=size,
+            extra_toppings=extra_toppings
+        )
         
         # 3. Crear pedido
         order = self._order_service.create_order(customer_name, pizza)
@@ -0,0 +1,63 @@
+# application/use_cases/export_orders.py
+"""
+Caso de uso: Exportar pedidos.
+
+SOLID:
+- SRP: Una clase, una responsabilidad (exportar pedidos)
+- DIP: Depende del repositorio y de exportadores abstractos
+"""
+
+from domain.interfaces import OrderRepository, OrderExporter
+from domain.exceptions import InvalidQueryException, UnsupportedExportFormatException
+from typing import Any, Dict, Iterator, List
+
+# Tope de filas por grupo: la memoria del export depende de este tamaño
+MAX_ROW_GROUP_SIZE = 1 << 20
+
+class ExportOrdersUseCase:
+    """Caso de uso: Exportar pedidos en formato columnar por grupos de filas"""
+    
+    def __init__(
+        self,
+        order_repository: OrderRepository,
+        exporters: Dict[str, OrderExporter]
+    ):
+        """Inyección de dependencias"""
+        self._order_repo = order_repository
+        self._exporters = exporters
+    
+    def formats(self) -> List[str]:
+        """Formatos disponibles"""
+        return list(self._exporters)
+    
+    def exporter_for(self, file_format: str) -> OrderExporter:
+        """Obtener el exportador de un formato"""
+        if file_format not in self._exporters:
+            raise UnsupportedExportFormatException(
+                f"Formato '{file_format}' no disponible "
+                f"(disponibles: {', '.join(self._exporters)})"
+            )
+        return self._exporters[file_format]
+    
+    def stream(self, file_format: str, row_group_size: int = 65_536) -> Iterator[bytes]:
+        """Exportar directamente desde el iterador del repositorio"""
+        exporter = self.exporter_for(file_format)
+        if not 0 < row_group_size <= MAX_ROW_GROUP_SIZE:
+            raise InvalidQueryException(
+                f"row_group_size debe estar entre 1 y {MAX_ROW_GROUP_SIZE}"
+            )
+        return exporter.export(self._order_repo.iter_all(), row_group_size)
+    
+    def execute(self, path: str, file_format: str, row_group_size: int = 65_536) -> Dict[str, Any]:
+        """Exportar a un archivo y retornar un resumen"""
+        written = 0
+        with open(path, 'wb') as f:
+            for chunk in self.stream(file_format, row_group_size):
+                f.write(chunk)
+                written += len(chunk)
+        return {
+            'success': True,
+            'format': file_format,
+            'path': path,
+            'bytes': written
+        }
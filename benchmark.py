@@ -0,0 +1,366 @@
+"""
+Script de benchmarks del sistema.
+Mide la latencia de las operaciones del menu y los pedidos con
+volumenes grandes de datos sinteticos.
+
+Uso:
+    python benchmark.py            # ejecutar todos
+    python benchmark.py search     # ejecutar uno
+"""
+
+import os
+import random
+import sys
+import tempfile
+import time
+import tracemalloc
+from datetime import datetime
+from typing import Callable, Dict, Iterator, List, Tuple
+
+from application.services.order_service import OrderService
+from application.services.pizza_service import PizzaService
+from application.services.store_service import StoreService
+from application.services.diagnostics_service import MemoryDiagnosticsService
+from application.use_cases.create_order import CreateOrderUseCase
+from domain.entities import Order, Pizza
+from infrastructure.export.order_exporters import available_exporters
+from infrastructure.cache.derived_prototype_cache import LRUPrototypeCache
+from infrastructure.repositories.menu_repository import InMemoryMenuRepository
+from infrastructure.repositories.order_repository import InMemoryOrderRepository
+
+INGREDIENTS = [
+    "pepperoni", "jamón", "piña", "champiñones", "aceitunas", "cebolla",
+    "pimiento", "albahaca", "tomate fresco", "orégano", "salchicha",
+    "tocino", "anchoas", "rúcula", "alcachofa", "pollo", "maíz", "jalapeño",
+]
+CHEESES = ["mozzarella", "cheddar", "provolone", "mezcla de 4 quesos", "vegano"]
+SAUCES = ["tomate", "barbacoa", "pesto", "crema", "picante"]
+NAME_WORDS = [
+    "clásica", "suprema", "rústica", "picante", "vegetal", "especial",
+    "casa", "norte", "sur", "doble", "mediterránea", "criolla",
+]
+
+
+def _percentile(samples: List[float], pct: float) -> float:
+    ordered = sorted(samples)
+    index = min(len(ordered) - 1, int(len(ordered) * pct / 100))
+    return ordered[index]
+
+
+def _report(label: str, samples: List[float]) -> None:
+    """Imprimir latencias en microsegundos"""
+    micros = [s * 1_000_000 for s in samples]
+    print(f"   - {label:<40} "
+          f"p50={_percentile(micros, 50):9.1f}us "
+          f"p99={_percentile(micros, 99):9.1f}us "
+          f"media={sum(micros) / len(micros):9.1f}us")
+
+
+def _timeit(fn: Callable[[], object], repeat: int) -> List[float]:
+    samples = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        fn()
+        samples.append(time.perf_counter() - start)
+    return samples
+
+
+def _allocations(fn: Callable[[], object]) -> Tuple[int, int]:
+    """Bloques retenidos por el resultado y pico de bytes durante la llamada"""
+    tracemalloc.start()
+    before = tracemalloc.take_snapshot()
+    tracemalloc.reset_peak()
+    result = fn()
+    _, peak = tracemalloc.get_traced_memory()
+    after = tracemalloc.take_snapshot()
+    tracemalloc.stop()
+    blocks = sum(stat.count_diff for stat in after.compare_to(before, "filename"))
+    del result
+    return blocks, peak
+
+
+def build_large_menu(n_templates: int, seed: int = 42) -> InMemoryMenuRepository:
+    """Crear un repositorio con n templates sinteticos (mas los 4 por defecto)"""
+    rng = random.Random(seed)
+    repo = InMemoryMenuRepository()
+    for i in range(n_templates):
+        name = f"{rng.choice(NAME_WORDS)} {rng.choice(NAME_WORDS)} {i}"
+        repo.register(name, Pizza(
+            id="",
+            name=name,
+            size="medium",
+            base="masa tradicional",
+            sauce=rng.choice(SAUCES),
+            cheese=rng.choice(CHEESES),
+            toppings=rng.sample(INGREDIENTS, rng.randint(2, 6)),
+            price=round(rng.uniform(7.0, 25.0), 2),
+            cooking_time=rng.randint(8, 25),
+            created_at=datetime.now()
+        ))
+    return repo
+
+
+def bench_search(n_templates: int = 10_000, repeat: int = 200) -> None:
+    """Busqueda por indices vs filtrar clonando todo el menu"""
+    print(f"\nBusqueda en el menu ({n_templates} templates)")
+    repo = build_large_menu(n_templates)
+
+    queries = {
+        "with=pepperoni,jamón": dict(with_ingredients=["pepperoni", "jamón"]),
+        "with=piña without=jamón max_price=12": dict(
+            with_ingredients=["piña"], without_ingredients=["jamón"], max_price=12.0),
+        "q=suprema max_cooking_time=10": dict(query="suprema", max_cooking_time=10),
+        "max_price=8": dict(max_price=8.0),
+    }
+    for label, kwargs in queries.items():
+        results = repo.search(**kwargs)
+        _report(f"{label} ({len(results)})",
+                _timeit(lambda: repo.search(**kwargs), repeat))
+
+    def scan():
+        return [p for p in repo.list_all()
+                if "pepperoni" in p.toppings and "jamón" in p.toppings]
+    _report("list_all + filtro (antes)", _timeit(scan, max(1, repeat // 20)))
+
+    service = PizzaService(repo)
+    _report("GET /menu/search sin filtros, limit=50",
+            _timeit(lambda: service.search_menu(limit=50), repeat))
+    _report("GET /menu/search sin filtros, sin limit",
+            _timeit(lambda: service.search_menu(), max(1, repeat // 20)))
+
+
+def bench_menu_views(repeat: int = 20) -> None:
+    """GET /menu con vistas de solo lectura vs clonar todo el menu"""
+    for n_pizzas in (4, 1_000, 10_000):
+        print(f"\nLectura del menu ({n_pizzas} pizzas)")
+        service = PizzaService(build_large_menu(n_pizzas - 4))
+
+        def cloned():
+            # Camino anterior: list_all clona cada template
+            return [service._pizza_to_dict(p) for p in service._menu_repo.list_all()]
+
+        paths = {
+            "list_all + clone (antes)": cloned,
+            "vistas, menu completo": service.get_menu,
+            "vistas, fields=name,price": lambda: service.get_menu_page(
+                fields=["name", "price"]),
+            "vistas, limit=50": lambda: service.get_menu_page(limit=50),
+        }
+        for label, fn in paths.items():
+            blocks, peak = _allocations(fn)
+            _report(f"{label} [{blocks} bloques, pico {peak // 1024} KiB]",
+                    _timeit(fn, repeat))
+
+
+def zipf_order_mix(n_orders: int, s: float = 1.1, seed: int = 7) -> List[Tuple]:
+    """Pedidos (pizza, tamaño, extras) con popularidad Zipf sobre las configuraciones"""
+    rng = random.Random(seed)
+    extras = [[], ["queso extra"], ["champiñones"], ["aceitunas", "cebolla"],
+              ["queso extra", "tocino"], ["jalapeño"], ["piña"], ["pollo", "maíz"]]
+    configs = [(name, size, tuple(extra))
+               for name in ("pepperoni", "margarita", "hawaiana", "4quesos")
+               for size in ("large", "medium", "small")
+               for extra in extras]
+    rng.shuffle(configs)
+    weights = [1 / (rank ** s) for rank in range(1, len(configs) + 1)]
+    return rng.choices(configs, weights=weights, k=n_orders)
+
+
+def bench_derived_prototypes(n_orders: int = 20_000) -> None:
+    """CreateOrderUseCase con y sin cache de prototipos derivados (mezcla Zipf)"""
+    print(f"\nPedidos con mezcla Zipf ({n_orders} pedidos)")
+    orders = zipf_order_mix(n_orders)
+
+    variants = [("sin cache (antes)", None)]
+    variants += [(f"cache LRU de {size}", LRUPrototypeCache(size)) for size in (32, 256)]
+    for label, cache in variants:
+        menu_repo = InMemoryMenuRepository()
+        if cache is not None:
+            menu_repo.subscribe(cache.invalidate)
+        use_case = CreateOrderUseCase(
+            PizzaService(menu_repo, cache), OrderService(InMemoryOrderRepository()))
+
+        samples = []
+        for name, size, extra in orders:
+            start = time.perf_counter()
+            use_case.execute(name, "cliente", size=size, extra_toppings=list(extra))
+            samples.append(time.perf_counter() - start)
+        _report(label, samples)
+        if cache is not None:
+            stats = cache.stats()
+            print(f"     hit_rate={stats['hit_rate']:.1%} "
+                  f"evictions={stats['evictions']} size={stats['size']}")
+
+
+def bench_stores(n_orders: int = 20_000) -> None:
+    """Throughput de pedidos y lecturas de menu al crecer el numero de tiendas"""
+    print(f"\nMulti-tienda ({n_orders} pedidos + {n_orders} lecturas de menu)")
+    for n_stores in (1, 10, 100, 1_000):
+        tracemalloc.start()
+        store_ids = [f"tienda-{i}" for i in range(n_stores)]
+        stores = StoreService(
+            shared_menu=InMemoryMenuRepository(),
+            order_repository_factory=InMemoryOrderRepository,
+            prototype_cache_factory=lambda: LRUPrototypeCache(256),
+            store_ids=store_ids
+        )
+        setup_bytes, _ = tracemalloc.get_traced_memory()
+        tracemalloc.stop()
+
+        rng = random.Random(3)
+        orders = zipf_order_mix(n_orders)
+        start = time.perf_counter()
+        for name, size, extra in orders:
+            store = stores.get(rng.choice(store_ids))
+            store.create_order_use_case.execute(
+                name, "cliente", size=size, extra_toppings=list(extra))
+        orders_elapsed = time.perf_counter() - start
+
+        start = time.perf_counter()
+        for _ in range(n_orders):
+            stores.get(rng.choice(store_ids)).pizza_service.get_menu_page(limit=10)
+        menu_elapsed = time.perf_counter() - start
+
+        print(f"   - {n_stores:>5} tiendas: "
+              f"pedidos={n_orders / orders_elapsed:9.0f}/s "
+              f"menu={n_orders / menu_elapsed:9.0f}/s "
+              f"memoria inicial={setup_bytes // 1024} KiB")
+
+    # Tiendas con un template propio sobre un menu grande: cada una solo
+    # guarda su capa (template, vista e indice), no una copia del menu
+    n_templates = 10_000
+    shared_menu = build_large_menu(n_templates)
+    custom = shared_menu.get("margarita")
+    for n_stores in (10, 100):
+        store_ids = [f"tienda-{i}" for i in range(n_stores)]
+        stores = StoreService(
+            shared_menu=shared_menu,
+            order_repository_factory=InMemoryOrderRepository,
+            store_ids=store_ids
+        )
+        tracemalloc.start()
+        for store_id in store_ids:
+            stores.register_template(store_id, "napolitana", custom)
+        custom_bytes, _ = tracemalloc.get_traced_memory()
+        tracemalloc.stop()
+        print(f"   - {n_stores:>5} tiendas con template propio (menu de {n_templates}): "
+              f"{custom_bytes / n_stores / 1024:.1f} KiB por tienda")
+
+
+def synthetic_orders(n_orders: int, seed: int = 11) -> Iterator[Order]:
+    """Pedidos generados bajo demanda (no se guardan todos en memoria)"""
+    rng = random.Random(seed)
+    menu = InMemoryMenuRepository()
+    prototypes = [menu.get(name) for name in ("margarita", "pepperoni", "hawaiana", "4quesos")]
+    sizes = ["small", "medium", "large"]
+    ordered_at = datetime(2026, 1, 1)
+    for i in range(n_orders):
+        base = rng.choice(prototypes)
+        yield Order(
+            order_id=f"{i:08x}",
+            customer_name=f"cliente {rng.randint(1, 50_000)}",
+            pizza=Pizza(
+                id=f"p{i:07x}",
+                name=base.name,
+                size=rng.choice(sizes),
+                base=base.base,
+                sauce=base.sauce,
+                cheese=base.cheese,
+                toppings=base.toppings + rng.sample(INGREDIENTS, rng.randint(0, 2)),
+                price=base.price,
+                cooking_time=base.cooking_time,
+                created_at=ordered_at
+            ),
+            status="preparando",
+            ordered_at=ordered_at
+        )
+
+
+def bench_export(sizes: Tuple[int, ...] = (1_000_000, 10_000_000),
+                 row_group_size: int = 65_536) -> None:
+    """
+    Throughput y memoria pico de la exportacion por formato, leyendo de
+    InMemoryOrderRepository.iter_all (el mismo camino que GET /order/export).
+    EXPORT_SIZES=100000,1000000 cambia los tamanos (10M pedidos en el
+    repositorio necesitan varios GiB de RAM).
+    """
+    sizes = tuple(int(n) for n in os.environ.get("EXPORT_SIZES", "").split(",") if n) or sizes
+    exporters = available_exporters()
+
+    for n_orders in sizes:
+        print(f"\nExportacion de {n_orders} pedidos (grupos de {row_group_size} filas)")
+        repo = _filled_order_repository(n_orders)
+        for name, exporter in exporters.items():
+            with tempfile.TemporaryFile() as f:
+                start = time.perf_counter()
+                for chunk in exporter.export(repo.iter_all(), row_group_size):
+                    f.write(chunk)
+                elapsed = time.perf_counter() - start
+                size = f.tell()
+
+            # Pico en una segunda pasada: los pedidos se guardaron antes de
+            # activar tracemalloc, asi solo se mide el recorrido y la
+            # codificacion (debe depender de row_group_size, no de n_orders)
+            tracemalloc.start()
+            for _ in exporter.export(repo.iter_all(), row_group_size):
+                pass
+            peak = tracemalloc.get_traced_memory()[1]
+            tracemalloc.stop()
+
+            print(f"   - {name:<9} {n_orders / elapsed:10.0f} filas/s "
+                  f"archivo={size / 1024 / 1024:8.1f} MiB "
+                  f"pico={peak / 1024 / 1024:6.1f} MiB")
+        del repo
+
+
+def _filled_order_repository(n_orders: int) -> InMemoryOrderRepository:
+    repo = InMemoryOrderRepository()
+    for order in synthetic_orders(n_orders):
+        repo.save(order)
+    return repo
+
+
+def bench_memory_report(n_orders: int = 100_000, n_stores: int = 1_000) -> None:
+    """Costo del reporte de memoria y del muestreo al guardar pedidos"""
+    print(f"\nReporte de memoria ({n_orders} pedidos en {n_stores} tiendas)")
+    store_ids = [f"tienda-{i}" for i in range(n_stores)]
+    shared_menu = InMemoryMenuRepository()
+    stores = StoreService(
+        shared_menu=shared_menu,
+        order_repository_factory=lambda: InMemoryOrderRepository(
+            template_of=shared_menu.template_of),
+        prototype_cache_factory=lambda: LRUPrototypeCache(256, template_of=shared_menu.template_of),
+        store_ids=store_ids
+    )
+    orders = list(synthetic_orders(n_orders))
+
+    samples = []
+    for i, order in enumerate(orders):
+        repo = stores.get(store_ids[i % n_stores]).order_repository
+        start = time.perf_counter()
+        repo.save(order)
+        samples.append(time.perf_counter() - start)
+    _report("save (con muestreo de tamano)", samples)
+
+    diagnostics = MemoryDiagnosticsService({'stores': stores})
+    _report("GET /admin/memory (get_report)", _timeit(diagnostics.get_report, 50))
+    report = diagnostics.get_report()
+    print(f"     estimado={report['approx_bytes'] // 1024} KiB "
+          f"Order={report['entities']['Order']['avg_bytes']} B "
+          f"Pizza={report['entities']['Pizza']['avg_bytes']} B")
+
+
+BENCHMARKS: Dict[str, Callable[[], None]] = {
+    "search": bench_search,
+    "views": bench_menu_views,
+    "derived": bench_derived_prototypes,
+    "stores": bench_stores,
+    "export": bench_export,
+    "memory": bench_memory_report,
+}
+
+
+if __name__ == "__main__":
+    selected = sys.argv[1:] or list(BENCHMARKS)
+    for name in selected:
+        BENCHMARKS[name]()
@@ -9,7 +9,7 @@ SOLID:
 """
 
 from dataclasses import dataclass
-from typing import List
+from typing import List, Tuple
 from datetime import datetime
 import uuid
 import copy
@@ -52,6 +52,38 @@ class Pizza:
         self.price += 1.50  # Cada ingrediente cuesta $1.50
 
 
+@dataclass(frozen=True, slots=True)
+class PizzaView:
+    """
+    Vista de solo lectura de un prototipo de pizza.
+    Comparte los datos del prototipo: no clona ni genera un nuevo ID.
+    """
+    id: str
+    name: str
+    size: str
+    base: str
+    sauce: str
+    cheese: str
+    toppings: Tuple[str, ...]
+    price: float
+    cooking_time: int
+
+    @classmethod
+    def from_pizza(cls, pizza: Pizza) -> 'PizzaView':
+        """Crear la vista de un prototipo"""
+        return cls(
+            id=pizza.id,
+            name=pizza.name,
+            size=pizza.size,
+            base=pizza.base,
+            sauce=pizza.sauce,
+            cheese=pizza.cheese,
+            toppings=tuple(pizza.toppings),
+            price=pizza.price,
+            cooking_time=pizza.cooking_time
+        )
+
+
 @dataclass
 class Order:
     """Entidad Order - Representa un pedido"""
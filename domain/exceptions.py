@@ -23,4 +23,33 @@ class OrderNotFoundException(DomainException):
 
 class InvalidSizeException(DomainException):
     """Tamaño de pizza inválido"""
-    pass
\ No newline at end of file
+    pass
+
+
+class InvalidQueryException(DomainException):
+    """Parámetros de consulta inválidos (campos, límite o cursor)"""
+    pass
+
+
+class UnsupportedExportFormatException(DomainException):
+    """Formato de exportación desconocido o no disponible"""
+    pass
+
+
+class StoreNotFoundException(DomainException):
+    """Tienda inválida o no disponible"""
+    pass
+
+
+class StoreLimitException(DomainException):
+    """Se alcanzó el máximo de tiendas de este proceso"""
+    pass
+
+
+class StoreNotOwnedException(DomainException):
+    """La tienda pertenece a otro proceso worker"""
+    
+    def __init__(self, store_id: str, owner: str):
+        super().__init__(f"La tienda '{store_id}' la atiende el worker '{owner}'")
+        self.store_id = store_id
+        self.owner = owner
\ No newline at end of file
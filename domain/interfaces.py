@@ -9,8 +9,8 @@ SOLID:
 """
 
 from abc import ABC, abstractmethod
-from typing import List, Optional
-from domain.entities import Pizza, Order
+from typing import Any, Callable, Dict, List, Optional, Iterable, Iterator, Tuple
+from domain.entities import Pizza, PizzaView, Order
 
 class PizzaPrototype(ABC):
     """Interfaz para prototipos de pizza"""
@@ -21,6 +21,50 @@ class PizzaPrototype(ABC):
         pass
 
 
+class MemoryAccountable(ABC):
+    """
+    Interfaz para componentes que reportan su memoria aproximada.
+    Se implementa junto a la interfaz del componente (p. ej. un
+    repositorio en memoria), no forma parte de ella.
+    """
+    
+    @abstractmethod
+    def memory_usage(self) -> Dict[str, Any]:
+        """
+        Memoria aproximada, sin recorrer todos los objetos:
+        {'entries', 'approx_bytes', 'entities': {nombre: {'avg_bytes', 'samples'}}}
+        """
+        pass
+
+
+class MemoryProfiler(ABC):
+    """Interfaz para el perfilado de memoria bajo demanda"""
+    
+    @abstractmethod
+    def start(self, frames: int = 1) -> None:
+        """Empezar a perfilar y tomar la instantánea base"""
+        pass
+    
+    @abstractmethod
+    def stop(self) -> None:
+        """Dejar de perfilar"""
+        pass
+    
+    @abstractmethod
+    def is_tracing(self) -> bool:
+        """¿Está perfilando?"""
+        pass
+    
+    @abstractmethod
+    def diff(self, limit: int = 20) -> Dict[str, Any]:
+        """Diferencias por módulo desde la instantánea anterior"""
+        pass
+
+
+# Clave de un prototipo derivado: (template, tamaño, ingredientes extra)
+PrototypeKey = Tuple[str, Optional[str], Tuple[str, ...]]
+
+
 class MenuRepository(ABC):
     """Interfaz para el repositorio de menú"""
     
@@ -38,6 +82,80 @@ class MenuRepository(ABC):
     def list_all(self) -> List[Pizza]:
         """Listar todas las pizzas"""
         pass
+    
+    @abstractmethod
+    def template_of(self, pizza: Pizza) -> Optional[Pizza]:
+        """Template del que se copió una pizza (None si no se encuentra)"""
+        pass
+    
+    @abstractmethod
+    def search(
+        self,
+        with_ingredients: Iterable[str] = (),
+        without_ingredients: Iterable[str] = (),
+        max_price: Optional[float] = None,
+        max_cooking_time: Optional[int] = None,
+        query: Optional[str] = None
+    ) -> List[PizzaView]:
+        """Buscar pizzas que cumplan los filtros (vistas, sin clonar)"""
+        pass
+    
+    @abstractmethod
+    def get_view(self, name: str) -> PizzaView:
+        """Obtener una vista de solo lectura (sin clonar)"""
+        pass
+    
+    @abstractmethod
+    def list_views(self, offset: int = 0, limit: Optional[int] = None) -> List[PizzaView]:
+        """Listar vistas de solo lectura en orden de registro (sin clonar)"""
+        pass
+    
+    @abstractmethod
+    def count(self) -> int:
+        """Cantidad de pizzas en el menú"""
+        pass
+    
+    @abstractmethod
+    def subscribe(self, listener: Callable[[str], None]) -> None:
+        """Recibir el nombre de cada template registrado o reemplazado"""
+        pass
+    
+    @abstractmethod
+    def snapshot(self) -> 'MenuRepository':
+        """Copia independiente del menú que comparte los templates"""
+        pass
+
+
+class PrototypeCache(ABC):
+    """Interfaz para la caché de prototipos derivados"""
+    
+    @abstractmethod
+    def get(self, key: PrototypeKey) -> Optional[Pizza]:
+        """Obtener un prototipo derivado (None si no está)"""
+        pass
+    
+    @abstractmethod
+    def generation(self, template_name: str) -> int:
+        """Generación actual de un template (cambia al invalidarlo)"""
+        pass
+    
+    @abstractmethod
+    def put(self, key: PrototypeKey, prototype: Pizza, generation: int) -> bool:
+        """
+        Guardar un prototipo derivado de la generación indicada.
+        Si el template se invalidó desde entonces no se guarda (False).
+        """
+        pass
+    
+    @abstractmethod
+    def invalidate(self, template_name: str) -> None:
+        """Descartar los prototipos derivados de un template"""
+        pass
+    
+    @abstractmethod
+    def stats(self) -> Dict[str, Any]:
+        """Métricas de uso de la caché"""
+        pass
 
 
 class OrderRepository(ABC):
@@ -56,4 +174,22 @@ class OrderRepository(ABC):
     @abstractmethod
     def get_all(self) -> List[Order]:
         """Obtener todos los pedidos"""
+        pass
+    
+    @abstractmethod
+    def iter_all(self) -> Iterator[Order]:
+        """Recorrer todos los pedidos sin construir una lista de resultados"""
+        pass
+
+
+class OrderExporter(ABC):
+    """Interfaz para exportar pedidos en un formato de archivo"""
+    
+    format_name: str
+    content_type: str
+    extension: str
+    
+    @abstractmethod
+    def export(self, orders: Iterable[Order], row_group_size: int = 65_536) -> Iterator[bytes]:
+        """Codificar los pedidos como flujo de bytes, por grupos de filas"""
         pass
\ No newline at end of file
@@ -0,0 +1,146 @@
+# infrastructure/cache/derived_prototype_cache.py
+"""
+Caché LRU de prototipos derivados.
+
+Guarda prototipos ya personalizados (tamaño + ingredientes extra) para
+que las configuraciones repetidas se obtengan con una sola copia, sin
+repetir el ajuste de tamaño ni cada add_topping. Cada template tiene una
+generación: un put construido antes de la última invalidación se
+descarta, así un register concurrente no deja prototipos obsoletos.
+
+SOLID:
+- SRP: Solo almacena prototipos derivados y sus métricas
+- DIP: Implementa la interfaz PrototypeCache
+"""
+
+import sys
+import threading
+from collections import OrderedDict
+from typing import Any, Callable, Dict, Optional, Set
+from domain.interfaces import MemoryAccountable, PrototypeCache, PrototypeKey
+from domain.entities import Pizza
+from infrastructure.diagnostics.memory import approx_sizeof, prototype_values
+
+class LRUPrototypeCache(PrototypeCache, MemoryAccountable):
+    """Caché LRU acotada de prototipos derivados"""
+    
+    def __init__(
+        self,
+        max_size: int = 256,
+        template_of: Optional[Callable[[Pizza], Optional[Pizza]]] = None
+    ):
+        """
+        template_of: template del que se derivó cada prototipo; los
+        valores que comparte con él no se cuentan en su tamaño.
+        """
+        if max_size <= 0:
+            raise ValueError("max_size debe ser mayor que 0")
+        self._max_size = max_size
+        self._template_of = template_of
+        self._entries: 'OrderedDict[PrototypeKey, Pizza]' = OrderedDict()
+        # Claves por template, para invalidar sin recorrer toda la caché
+        self._keys_by_template: Dict[str, Set[PrototypeKey]] = {}
+        # Generación por template: invalidate la incrementa y put rechaza
+        # prototipos construidos antes (evita guardar uno obsoleto)
+        self._generations: Dict[str, int] = {}
+        # Bytes aproximados por entrada, medidos al guardar
+        self._entry_bytes: Dict[PrototypeKey, int] = {}
+        self._bytes = 0
+        self._lock = threading.Lock()
+        self._hits = 0
+        self._misses = 0
+        self._evictions = 0
+        self._invalidations = 0
+        self._stale_puts = 0
+    
+    def get(self, key: PrototypeKey) -> Optional[Pizza]:
+        """Obtener un prototipo derivado (None si no está)"""
+        with self._lock:
+            prototype = self._entries.get(key)
+            if prototype is None:
+                self._misses += 1
+                return None
+            self._entries.move_to_end(key)
+            self._hits += 1
+            return prototype
+    
+    def generation(self, template_name: str) -> int:
+        """Generación actual de un template"""
+        with self._lock:
+            return self._generations.get(template_name.lower(), 0)
+    
+    def put(self, key: PrototypeKey, prototype: Pizza, generation: int) -> bool:
+        """
+        Guardar un prototipo derivado, expulsando el menos usado.
+        Se descarta si el template se invalidó después de leer la generación.
+        """
+        template = self._template_of(prototype) if self._template_of else None
+        shared = prototype_values(template) if template is not None else set()
+        # La clave comparte el tamaño y los ingredientes extra con el prototipo
+        size = (approx_sizeof(prototype, shared)
+                + approx_sizeof(key, shared | prototype_values(prototype)))
+        with self._lock:
+            if self._generations.get(key[0], 0) != generation:
+                self._stale_puts += 1
+                return False
+            if key in self._entries:
+                self._entries.move_to_end(key)
+            self._entries[key] = prototype
+            self._bytes += size - self._entry_bytes.get(key, 0)
+            self._entry_bytes[key] = size
+            self._keys_by_template.setdefault(key[0], set()).add(key)
+            
+            while len(self._entries) > self._max_size:
+                evicted, _ = self._entries.popitem(last=False)
+                self._forget(evicted)
+                self._evictions += 1
+            return True
+    
+    def invalidate(self, template_name: str) -> None:
+        """Descartar los prototipos derivados de un template"""
+        template_name = template_name.lower()
+        with self._lock:
+            self._generations[template_name] = self._generations.get(template_name, 0) + 1
+            keys = self._keys_by_template.pop(template_name, set())
+            for key in keys:
+                del self._entries[key]
+                self._bytes -= self._entry_bytes.pop(key, 0)
+            self._invalidations += len(keys)
+    
+    def stats(self) -> Dict[str, Any]:
+        """Métricas de uso de la caché"""
+        with self._lock:
+            lookups = self._hits + self._misses
+            return {
+                'size': len(self._entries),
+                'max_size': self._max_size,
+                'hits': self._hits,
+                'misses': self._misses,
+                'hit_rate': self._hits / lookups if lookups else 0.0,
+                'evictions': self._evictions,
+                'invalidations': self._invalidations,
+                'stale_puts': self._stale_puts
+            }
+    
+    def memory_usage(self) -> Dict[str, Any]:
+        """Memoria aproximada de los prototipos en caché"""
+        with self._lock:
+            entries = len(self._entries)
+            return {
+                'entries': entries,
+                'approx_bytes': self._bytes + sys.getsizeof(self._entries),
+                'entities': {
+                    'Pizza': {
+                        'avg_bytes': round(self._bytes / entries, 1) if entries else 0.0,
+                        'samples': entries
+                    }
+                }
+            }
+    
+    def _forget(self, key: PrototypeKey) -> None:
+        self._bytes -= self._entry_bytes.pop(key, 0)
+        keys = self._keys_by_template.get(key[0])
+        if keys is not None:
+            keys.discard(key)
+            if not keys:
+                del self._keys_by_template[key[0]]
@@ -0,0 +1,108 @@
+# infrastructure/diagnostics/memory.py
+"""
+Estimación aproximada de memoria.
+
+approx_sizeof recorre un objeto y sus atributos (sys.getsizeof de cada
+parte). Es aproximado: los valores que se comparten con el prototipo del
+que se copió el objeto se deciden por identidad (prototype_values) y no
+se cuentan. Para no recorrer el heap en cada consulta, los repositorios
+estiman al escribir y, con muchos objetos, solo una muestra (SizeSampler).
+
+SOLID:
+- SRP: Solo estima tamaños
+"""
+
+import sys
+from typing import Any, Collection, Dict, Iterator, Optional, Set
+
+# Singletons: no ocupan memoria por cada objeto que los referencia
+_SINGLETONS = (type(None), bool)
+
+
+def approx_sizeof(obj: Any, shared: Collection[int] = ()) -> int:
+    """
+    Tamaño aproximado en bytes de un objeto y lo que contiene.
+    No se cuentan los objetos cuyo id está en shared (p. ej. los valores
+    de su prototipo, ver prototype_values), ni None, True o False, ni
+    los nombres de los atributos (los comparten todas las instancias).
+    """
+    return _sizeof(obj, set(shared))
+
+
+def prototype_values(prototype: Any) -> Set[int]:
+    """
+    Ids de los valores que las copias de un prototipo comparten con él:
+    sus atributos y los elementos de sus listas y tuplas (clone y
+    dataclasses.replace copian los contenedores, no los valores).
+    El prototipo debe seguir vivo mientras se usan los ids.
+    """
+    ids: Set[int] = set()
+    for value in _attributes(prototype):
+        ids.add(id(value))
+        if isinstance(value, (list, tuple)):
+            ids.update(id(item) for item in value)
+    return ids
+
+
+def _sizeof(obj: Any, seen: Set[int]) -> int:
+    if id(obj) in seen or isinstance(obj, _SINGLETONS):
+        return 0
+    seen.add(id(obj))
+    size = sys.getsizeof(obj)
+    if isinstance(obj, dict):
+        for key, value in obj.items():
+            size += _sizeof(key, seen) + _sizeof(value, seen)
+    elif isinstance(obj, (list, tuple, set, frozenset)):
+        for item in obj:
+            size += _sizeof(item, seen)
+    else:
+        if hasattr(obj, '__dict__'):
+            # Los nombres de atributos los comparten todas las instancias
+            attributes = vars(obj)
+            if id(attributes) not in seen:
+                seen.add(id(attributes))
+                size += sys.getsizeof(attributes)
+        for value in _attributes(obj):
+            size += _sizeof(value, seen)
+    return size
+
+
+def _attributes(obj: Any) -> Iterator[Any]:
+    if hasattr(obj, '__dict__'):
+        yield from vars(obj).values()
+    for slot in getattr(type(obj), '__slots__', ()):
+        if hasattr(obj, slot):
+            yield getattr(obj, slot)
+
+
+class SizeSampler:
+    """
+    Promedio de tamaño por muestreo: mide las primeras `warmup`
+    observaciones y luego una de cada `sample_every`.
+    """
+    
+    def __init__(self, sample_every: int = 16, warmup: int = 4):
+        self._sample_every = sample_every
+        self._warmup = warmup
+        self._observed = 0
+        self._samples = 0
+        self._total_bytes = 0
+    
+    def observe(self, obj: Any, prototype: Optional[Any] = None) -> None:
+        """Observar un objeto; los valores compartidos con prototype no cuentan"""
+        self._observed += 1
+        if self._observed <= self._warmup or self._observed % self._sample_every == 0:
+            shared = prototype_values(prototype) if prototype is not None else ()
+            self._samples += 1
+            self._total_bytes += approx_sizeof(obj, shared)
+    
+    @property
+    def samples(self) -> int:
+        return self._samples
+    
+    @property
+    def average(self) -> float:
+        return self._total_bytes / self._samples if self._samples else 0.0
+    
+    def summary(self) -> Dict[str, Any]:
+        return {'avg_bytes': round(self.average, 1), 'samples': self._samples}
@@ -0,0 +1,97 @@
+# infrastructure/diagnostics/tracemalloc_profiler.py
+"""
+Perfilador bajo demanda con tracemalloc.
+
+tracemalloc solo se activa cuando se pide (tiene costo en cada
+asignación). Cada diff compara con la instantánea anterior y agrupa las
+diferencias por módulo.
+
+SOLID:
+- SRP: Solo gestiona tracemalloc y sus instantáneas
+- DIP: Implementa la interfaz MemoryProfiler
+"""
+
+import os
+import sys
+import threading
+import tracemalloc
+from typing import Any, Dict, List, Optional
+from domain.interfaces import MemoryProfiler
+
+class TracemallocProfiler(MemoryProfiler):
+    """Diffs de instantáneas de tracemalloc agrupados por módulo"""
+    
+    def __init__(self):
+        self._baseline: Optional[tracemalloc.Snapshot] = None
+        self._lock = threading.Lock()
+    
+    def start(self, frames: int = 1) -> None:
+        """Activar tracemalloc y tomar la instantánea base"""
+        with self._lock:
+            if not tracemalloc.is_tracing():
+                tracemalloc.start(frames)
+            self._baseline = self._take_snapshot()
+    
+    def stop(self) -> None:
+        """Desactivar tracemalloc y descartar las instantáneas"""
+        with self._lock:
+            tracemalloc.stop()
+            self._baseline = None
+    
+    def is_tracing(self) -> bool:
+        return tracemalloc.is_tracing()
+    
+    def diff(self, limit: int = 20) -> Dict[str, Any]:
+        """Diferencias por módulo desde la instantánea anterior"""
+        with self._lock:
+            if not tracemalloc.is_tracing() or self._baseline is None:
+                return {'tracing': False, 'modules': []}
+            snapshot = self._take_snapshot()
+            stats = snapshot.compare_to(self._baseline, 'filename')
+            self._baseline = snapshot
+        
+        modules: Dict[str, Dict[str, int]] = {}
+        for stat in stats:
+            name = self._module_name(stat.traceback[0].filename)
+            entry = modules.setdefault(name, {
+                'size_bytes': 0, 'size_diff_bytes': 0, 'count': 0, 'count_diff': 0
+            })
+            entry['size_bytes'] += stat.size
+            entry['size_diff_bytes'] += stat.size_diff
+            entry['count'] += stat.count
+            entry['count_diff'] += stat.count_diff
+        
+        ranked: List[Dict[str, Any]] = sorted(
+            ({'module': name, **entry} for name, entry in modules.items()),
+            key=lambda entry: abs(entry['size_diff_bytes']),
+            reverse=True
+        )
+        traced, peak = tracemalloc.get_traced_memory()
+        return {
+            'tracing': True,
+            'traced_bytes': traced,
+            'peak_traced_bytes': peak,
+            'modules': ranked[:limit]
+        }
+    
+    @staticmethod
+    def _take_snapshot() -> tracemalloc.Snapshot:
+        return tracemalloc.take_snapshot().filter_traces((
+            tracemalloc.Filter(False, tracemalloc.__file__),
+            tracemalloc.Filter(False, "<frozen importlib._bootstrap>"),
+        ))
+    
+    @staticmethod
+    def _module_name(filename: str) -> str:
+        """Convertir la ruta de un archivo al nombre de su módulo"""
+        path = os.path.abspath(filename)
+        best = ""
+        for entry in sys.path:
+            root = os.path.abspath(entry or os.curdir)
+            if path.startswith(root + os.sep) and len(root) > len(best):
+                best = root
+        if not best:
+            return filename
+        module = os.path.splitext(os.path.relpath(path, best))[0]
+        module = module.replace(os.sep, '.')
+        return module[:-len('.__init__')] if module.endswith('.__init__') else module
@@ -0,0 +1,451 @@
+# infrastructure/export/order_exporters.py
+"""
+Exportadores de pedidos en formato columnar.
+
+Los pedidos se leen de un iterador y se agrupan en grupos de filas de
+tamaño fijo; cada grupo se codifica y se emite como bytes antes de leer
+el siguiente, así la memoria depende del tamaño del grupo y no del total.
+Nombres de pizza, tamaños, estados y toppings se codifican con
+diccionario.
+
+Formatos:
+- csv:      texto, toppings separados por '|'
+- columnar: binario compacto propio (ver ColumnarOrderExporter)
+- parquet / arrow: si pyarrow está instalado
+
+SOLID:
+- SRP: Cada exportador conoce un solo formato
+- OCP: Agregar un formato no modifica los existentes
+- DIP: Implementan la interfaz OrderExporter
+"""
+
+import csv
+import io
+import json
+import struct
+import sys
+from array import array
+from datetime import datetime, timedelta
+from itertools import islice
+from typing import Any, BinaryIO, Dict, Iterable, Iterator, List, Tuple
+from domain.interfaces import OrderExporter
+from domain.entities import Order
+
+try:
+    import pyarrow as pa
+    import pyarrow.parquet as pq
+except ImportError:  # pragma: no cover - dependencia opcional
+    pa = None
+    pq = None
+
+EPOCH = datetime(1970, 1, 1)
+_BIG_ENDIAN = sys.byteorder == 'big'
+
+# (columna, tipo): str, dict, dict_list, int64, int32, float64
+SCHEMA: List[Tuple[str, str]] = [
+    ('order_id', 'str'),
+    ('customer_name', 'str'),
+    ('status', 'dict'),
+    ('ordered_at', 'int64'),
+    ('pizza_id', 'str'),
+    ('pizza_name', 'dict'),
+    ('size', 'dict'),
+    ('toppings', 'dict_list'),
+    ('price', 'float64'),
+    ('cooking_time', 'int32'),
+]
+
+
+def arrow_available() -> bool:
+    """¿Está instalado pyarrow (formatos parquet y arrow)?"""
+    return pa is not None
+
+
+def _to_micros(moment: datetime) -> int:
+    return (moment - EPOCH) // timedelta(microseconds=1)
+
+
+def _text(value: Any) -> str:
+    """Los campos de texto se exportan como str aunque se hayan guardado con otro tipo"""
+    return value if type(value) is str else str(value)
+
+
+class _Dictionary:
+    """Codificación por diccionario: valor -> código estable"""
+
+    def __init__(self):
+        self.codes: Dict[str, int] = {}
+        self.values: List[str] = []
+
+    def encode(self, value: str) -> int:
+        code = self.codes.get(value)
+        if code is None:
+            code = len(self.values)
+            self.codes[value] = code
+            self.values.append(value)
+        return code
+
+
+class RowGroupBuilder:
+    """Convierte un iterador de pedidos en grupos de filas columnares"""
+
+    def __init__(self, row_group_size: int):
+        if row_group_size <= 0:
+            raise ValueError("row_group_size debe ser mayor que 0")
+        self.row_group_size = row_group_size
+        self.dictionaries = {
+            name: _Dictionary() for name, kind in SCHEMA if kind in ('dict', 'dict_list')
+        }
+
+    def row_groups(self, orders: Iterable[Order]) -> Iterator[Dict[str, Any]]:
+        iterator = iter(orders)
+        while True:
+            chunk = list(islice(iterator, self.row_group_size))
+            if not chunk:
+                return
+            yield self._build(chunk)
+
+    def _build(self, orders: List[Order]) -> Dict[str, Any]:
+        status = self.dictionaries['status']
+        pizza_name = self.dictionaries['pizza_name']
+        size = self.dictionaries['size']
+        toppings = self.dictionaries['toppings']
+
+        columns: Dict[str, Any] = {
+            'order_id': [],
+            'customer_name': [],
+            'status': array('I'),
+            'ordered_at': array('q'),
+            'pizza_id': [],
+            'pizza_name': array('I'),
+            'size': array('I'),
+            'toppings': (array('I', [0]), array('I')),
+            'price': array('d'),
+            'cooking_time': array('i'),
+        }
+        topping_offsets, topping_codes = columns['toppings']
+        for order in orders:
+            pizza = order.pizza
+            columns['order_id'].append(_text(order.order_id))
+            columns['customer_name'].append(_text(order.customer_name))
+            columns['status'].append(status.encode(_text(order.status)))
+            columns['ordered_at'].append(_to_micros(order.ordered_at))
+            columns['pizza_id'].append(_text(pizza.id))
+            columns['pizza_name'].append(pizza_name.encode(_text(pizza.name)))
+            columns['size'].append(size.encode(_text(pizza.size)))
+            for topping in pizza.toppings:
+                topping_codes.append(toppings.encode(_text(topping)))
+            topping_offsets.append(len(topping_codes))
+            columns['price'].append(pizza.price)
+            columns['cooking_time'].append(pizza.cooking_time)
+        columns['rows'] = len(orders)
+        return columns
+
+    def decode(self, name: str, codes: Iterable[int]) -> List[str]:
+        values = self.dictionaries[name].values
+        return [values[code] for code in codes]
+
+
+# ============================================
+# CSV
+# ============================================
+
+class CSVOrderExporter(OrderExporter):
+    """Exportador CSV (una fila por pedido)"""
+
+    format_name = 'csv'
+    content_type = 'text/csv; charset=utf-8'
+    extension = 'csv'
+
+    def export(self, orders: Iterable[Order], row_group_size: int = 65_536) -> Iterator[bytes]:
+        builder = RowGroupBuilder(row_group_size)
+        buffer = io.StringIO()
+        writer = csv.writer(buffer, lineterminator='\n')
+        writer.writerow([name for name, _ in SCHEMA])
+        yield buffer.getvalue().encode('utf-8')
+
+        for group in builder.row_groups(orders):
+            buffer.seek(0)
+            buffer.truncate()
+            offsets, codes = group['toppings']
+            topping_values = builder.dictionaries['toppings'].values
+            ordered_at = [
+                (EPOCH + timedelta(microseconds=micros)).isoformat()
+                for micros in group['ordered_at']
+            ]
+            writer.writerows(zip(
+                group['order_id'],
+                group['customer_name'],
+                builder.decode('status', group['status']),
+                ordered_at,
+                group['pizza_id'],
+                builder.decode('pizza_name', group['pizza_name']),
+                builder.decode('size', group['size']),
+                (
+                    '|'.join(topping_values[code] for code in codes[offsets[i]:offsets[i + 1]])
+                    for i in range(group['rows'])
+                ),
+                group['price'],
+                group['cooking_time'],
+            ))
+            yield buffer.getvalue().encode('utf-8')
+
+
+# ============================================
+# BINARIO COLUMNAR
+# ============================================
+
+class ColumnarOrderExporter(OrderExporter):
+    """
+    Exportador binario columnar compacto (little-endian).
+
+    archivo   := MAGIC grupo* footer uint32(len(footer)) MAGIC
+    grupo     := por cada columna del esquema: uint32(len(bloque)) bloque
+    footer    := JSON con esquema, offsets/filas de cada grupo y los
+                 diccionarios (los códigos son estables en todo el archivo)
+
+    Bloques por tipo:
+    - str:       uint32 offsets[filas + 1] + bytes UTF-8
+    - dict:      uint8 ancho (1, 2 o 4) + códigos[filas]
+    - dict_list: uint32 offsets[filas + 1] + uint8 ancho + códigos
+    - int64 / int32 / float64: valores
+    """
+
+    format_name = 'columnar'
+    content_type = 'application/octet-stream'
+    extension = 'pzc'
+    MAGIC = b'PZCOL1\x00\x00'
+
+    def export(self, orders: Iterable[Order], row_group_size: int = 65_536) -> Iterator[bytes]:
+        builder = RowGroupBuilder(row_group_size)
+        yield self.MAGIC
+        position = len(self.MAGIC)
+        row_groups = []
+        total_rows = 0
+
+        for group in builder.row_groups(orders):
+            blocks = [self._encode_column(kind, group[name]) for name, kind in SCHEMA]
+            data = b''.join(struct.pack('<I', len(block)) + block for block in blocks)
+            row_groups.append({'offset': position, 'rows': group['rows']})
+            position += len(data)
+            total_rows += group['rows']
+            yield data
+
+        footer = json.dumps({
+            'version': 1,
+            'schema': SCHEMA,
+            'rows': total_rows,
+            'row_groups': row_groups,
+            'dictionaries': {
+                name: dictionary.values for name, dictionary in builder.dictionaries.items()
+            },
+        }, ensure_ascii=False).encode('utf-8')
+        yield footer + struct.pack('<I', len(footer)) + self.MAGIC
+
+    @classmethod
+    def _encode_column(cls, kind: str, values: Any) -> bytes:
+        if kind == 'str':
+            encoded = [value.encode('utf-8') for value in values]
+            offsets = array('I', [0])
+            total = 0
+            for item in encoded:
+                total += len(item)
+                offsets.append(total)
+            return cls._le(offsets) + b''.join(encoded)
+        if kind == 'dict':
+            return cls._encode_codes(values)
+        if kind == 'dict_list':
+            offsets, codes = values
+            return cls._le(offsets) + cls._encode_codes(codes)
+        return cls._le(values)
+
+    @classmethod
+    def _encode_codes(cls, codes: array) -> bytes:
+        """Códigos con el ancho mínimo para el mayor código del bloque"""
+        largest = max(codes) if codes else 0
+        typecode, width = ('B', 1) if largest < 1 << 8 else ('H', 2) if largest < 1 << 16 else ('I', 4)
+        narrowed = codes if typecode == 'I' else array(typecode, codes)
+        return bytes([width]) + cls._le(narrowed)
+
+    @staticmethod
+    def _le(values: array) -> bytes:
+        if _BIG_ENDIAN and values.itemsize > 1:
+            values = array(values.typecode, values)
+            values.byteswap()
+        return values.tobytes()
+
+
+def read_columnar_orders(source: BinaryIO) -> Iterator[Dict[str, Any]]:
+    """Leer un archivo del formato columnar, fila por fila"""
+    magic = ColumnarOrderExporter.MAGIC
+    source.seek(-(len(magic) + 4), io.SEEK_END)
+    footer_length = struct.unpack('<I', source.read(4))[0]
+    if source.read(len(magic)) != magic:
+        raise ValueError("No es un archivo columnar de pedidos")
+    source.seek(-(len(magic) + 4 + footer_length), io.SEEK_END)
+    footer = json.loads(source.read(footer_length))
+    dictionaries = footer['dictionaries']
+    typecodes = {'int64': 'q', 'int32': 'i', 'float64': 'd'}
+    widths = {1: 'B', 2: 'H', 4: 'I'}
+
+    def unpack(typecode: str, data: bytes) -> array:
+        values = array(typecode)
+        values.frombytes(data)
+        if _BIG_ENDIAN and values.itemsize > 1:
+            values.byteswap()
+        return values
+
+    for row_group in footer['row_groups']:
+        source.seek(row_group['offset'])
+        rows = row_group['rows']
+        columns = {}
+        for name, kind in footer['schema']:
+            block = source.read(struct.unpack('<I', source.read(4))[0])
+            if kind == 'str':
+                offsets = unpack('I', block[:4 * (rows + 1)])
+                data = block[4 * (rows + 1):]
+                columns[name] = [
+                    data[offsets[i]:offsets[i + 1]].decode('utf-8') for i in range(rows)
+                ]
+            elif kind == 'dict':
+                codes = unpack(widths[block[0]], block[1:])
+                columns[name] = [dictionaries[name][code] for code in codes]
+            elif kind == 'dict_list':
+                offsets = unpack('I', block[:4 * (rows + 1)])
+                rest = block[4 * (rows + 1):]
+                codes = unpack(widths[rest[0]], rest[1:])
+                values = dictionaries[name]
+                columns[name] = [
+                    [values[code] for code in codes[offsets[i]:offsets[i + 1]]]
+                    for i in range(rows)
+                ]
+            else:
+                columns[name] = unpack(typecodes[kind], block)
+        for i in range(rows):
+            row = {name: columns[name][i] for name, _ in footer['schema']}
+            row['ordered_at'] = EPOCH + timedelta(microseconds=row['ordered_at'])
+            yield row
+
+
+# ============================================
+# PARQUET / ARROW (opcional)
+# ============================================
+
+class _ChunkSink(io.RawIOBase):
+    """Archivo de solo escritura que acumula bytes hasta vaciarlo"""
+
+    def __init__(self):
+        self._chunks: List[bytes] = []
+        self._position = 0
+
+    def writable(self) -> bool:
+        return True
+
+    def write(self, data) -> int:
+        data = bytes(data)
+        self._chunks.append(data)
+        self._position += len(data)
+        return len(data)
+
+    def tell(self) -> int:
+        return self._position
+
+    def drain(self) -> bytes:
+        data = b''.join(self._chunks)
+        self._chunks = []
+        return data
+
+
+class ArrowOrderExporter(OrderExporter):
+    """
+    Exportador Parquet o Arrow IPC stream (requiere pyarrow).
+
+    Arrow usa el formato stream con deltas de diccionario, ya que los
+    diccionarios solo crecen entre grupos. En Parquet los toppings se
+    escriben como lista de strings (Parquet los codifica con diccionario
+    al escribir; pyarrow no lee listas de diccionarios en varios grupos).
+    """
+
+    def __init__(self, file_format: str = 'parquet'):
+        if pa is None:
+            raise ImportError("pyarrow no está instalado")
+        if file_format not in ('parquet', 'arrow'):
+            raise ValueError("file_format debe ser 'parquet' o 'arrow'")
+        self.format_name = file_format
+        self.extension = 'parquet' if file_format == 'parquet' else 'arrows'
+        self.content_type = (
+            'application/vnd.apache.parquet' if file_format == 'parquet'
+            else 'application/vnd.apache.arrow.stream'
+        )
+
+    def export(self, orders: Iterable[Order], row_group_size: int = 65_536) -> Iterator[bytes]:
+        builder = RowGroupBuilder(row_group_size)
+        parquet = self.format_name == 'parquet'
+        topping_type = pa.string() if parquet else pa.dictionary(pa.int32(), pa.string())
+        schema = pa.schema([
+            ('order_id', pa.string()),
+            ('customer_name', pa.string()),
+            ('status', pa.dictionary(pa.int32(), pa.string())),
+            ('ordered_at', pa.timestamp('us')),
+            ('pizza_id', pa.string()),
+            ('pizza_name', pa.dictionary(pa.int32(), pa.string())),
+            ('size', pa.dictionary(pa.int32(), pa.string())),
+            ('toppings', pa.list_(topping_type)),
+            ('price', pa.float64()),
+            ('cooking_time', pa.int32()),
+        ])
+        sink = _ChunkSink()
+        if parquet:
+            writer = pq.ParquetWriter(sink, schema, use_dictionary=True)
+        else:
+            writer = pa.ipc.new_stream(
+                sink, schema, options=pa.ipc.IpcWriteOptions(emit_dictionary_deltas=True)
+            )
+
+        for group in builder.row_groups(orders):
+            offsets, codes = group['toppings']
+            topping_values = pa.DictionaryArray.from_arrays(
+                pa.array(codes, pa.int32()),
+                pa.array(builder.dictionaries['toppings'].values, pa.string())
+            )
+            if parquet:
+                topping_values = topping_values.dictionary_decode()
+            table = pa.table({
+                'order_id': pa.array(group['order_id'], pa.string()),
+                'customer_name': pa.array(group['customer_name'], pa.string()),
+                'status': self._dictionary_array(builder, 'status', group),
+                'ordered_at': pa.array(group['ordered_at'], pa.int64()).cast(pa.timestamp('us')),
+                'pizza_id': pa.array(group['pizza_id'], pa.string()),
+                'pizza_name': self._dictionary_array(builder, 'pizza_name', group),
+                'size': self._dictionary_array(builder, 'size', group),
+                'toppings': pa.ListArray.from_arrays(pa.array(offsets, pa.int32()), topping_values),
+                'price': pa.array(group['price'], pa.float64()),
+                'cooking_time': pa.array(group['cooking_time'], pa.int32()),
+            }, schema=schema)
+            if parquet:
+                writer.write_table(table, row_group_size=group['rows'])
+            else:
+                writer.write_table(table)
+            yield sink.drain()
+
+        writer.close()
+        yield sink.drain()
+
+    @staticmethod
+    def _dictionary_array(builder: RowGroupBuilder, name: str, group: Dict[str, Any]):
+        return pa.DictionaryArray.from_arrays(
+            pa.array(group[name], pa.int32()),
+            pa.array(builder.dictionaries[name].values, pa.string())
+        )
+
+
+def available_exporters() -> Dict[str, OrderExporter]:
+    """Exportadores disponibles según las dependencias instaladas"""
+    exporters: Dict[str, OrderExporter] = {
+        'csv': CSVOrderExporter(),
+        'columnar': ColumnarOrderExporter(),
+    }
+    if arrow_available():
+        exporters['parquet'] = ArrowOrderExporter('parquet')
+        exporters['arrow'] = ArrowOrderExporter('arrow')
+    return exporters
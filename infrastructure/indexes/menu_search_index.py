@@ -0,0 +1,249 @@
+# infrastructure/indexes/menu_search_index.py
+"""
+Índice de búsqueda del menú.
+
+Mantiene índices invertidos (término -> claves de templates) sobre
+ingredientes, queso, salsa y tokens del nombre, más índices ordenados
+por precio y tiempo de cocción. Las búsquedas se resuelven intersectando
+listas de claves, sin tocar (ni clonar) los templates que no coinciden.
+
+SOLID:
+- SRP: Solo indexa y resuelve búsquedas sobre claves de templates
+- OCP: El repositorio lo usa sin conocer cómo se indexa
+"""
+
+import re
+import sys
+from bisect import bisect_left, bisect_right
+from typing import Dict, Iterable, List, Optional, Set, Tuple
+from domain.entities import Pizza
+
+_TOKEN_RE = re.compile(r"\w+")
+
+
+def normalize_term(term: str) -> str:
+    """Normalizar un término de búsqueda"""
+    return term.strip().lower()
+
+
+def tokenize(text: str) -> List[str]:
+    """Dividir un texto en tokens en minúsculas"""
+    return _TOKEN_RE.findall(text.lower())
+
+
+class _SortedIndex:
+    """Índice ordenado por (valor, clave) para consultas de rango '<='"""
+
+    def __init__(self):
+        self._sorted_values: List[float] = []
+        self._sorted_keys: List[str] = []
+        self._values: Dict[str, float] = {}
+
+    def add(self, key: str, value: float) -> None:
+        low = bisect_left(self._sorted_values, value)
+        high = bisect_right(self._sorted_values, value)
+        position = bisect_left(self._sorted_keys, key, low, high)
+        self._sorted_values.insert(position, value)
+        self._sorted_keys.insert(position, key)
+        self._values[key] = value
+
+    def remove(self, key: str) -> None:
+        value = self._values.pop(key)
+        low = bisect_left(self._sorted_values, value)
+        high = bisect_right(self._sorted_values, value)
+        position = self._sorted_keys.index(key, low, high)
+        del self._sorted_values[position]
+        del self._sorted_keys[position]
+
+    def value_of(self, key: str) -> float:
+        return self._values[key]
+
+    def approx_bytes(self) -> int:
+        return (sys.getsizeof(self._sorted_values) + sys.getsizeof(self._sorted_keys)
+                + sys.getsizeof(self._values))
+
+    def copy(self) -> '_SortedIndex':
+        other = _SortedIndex()
+        other._sorted_values = list(self._sorted_values)
+        other._sorted_keys = list(self._sorted_keys)
+        other._values = dict(self._values)
+        return other
+
+    def count_at_most(self, limit: float) -> int:
+        """Cantidad de claves con valor <= limit"""
+        return bisect_right(self._sorted_values, limit)
+
+    def keys_at_most(self, limit: float) -> Set[str]:
+        """Claves con valor <= limit"""
+        return set(self._sorted_keys[:self.count_at_most(limit)])
+
+    def ordered(self, keys: Optional[Set[str]] = None) -> List[str]:
+        """
+        Claves ordenadas por (valor, clave); con keys, solo esas.
+        Si son pocas se ordenan; si no, se filtra el orden ya existente.
+        """
+        if keys is None:
+            return list(self._sorted_keys)
+        if len(keys) * 8 < len(self._sorted_keys):
+            return sorted(keys, key=lambda key: (self._values[key], key))
+        return [key for key in self._sorted_keys if key in keys]
+
+
+class MenuSearchIndex:
+    """Índices invertidos y ordenados sobre los templates del menú"""
+
+    def __init__(self):
+        self._by_topping: Dict[str, Set[str]] = {}
+        self._by_cheese: Dict[str, Set[str]] = {}
+        self._by_sauce: Dict[str, Set[str]] = {}
+        self._by_name_token: Dict[str, Set[str]] = {}
+        self._by_price = _SortedIndex()
+        self._by_cooking_time = _SortedIndex()
+        # Términos indexados por clave, para poder des-indexar al reemplazar
+        self._terms: Dict[str, Tuple[List[str], str, str, List[str]]] = {}
+
+    def __len__(self) -> int:
+        return len(self._terms)
+
+    def approx_bytes(self) -> int:
+        """Bytes aproximados de las estructuras del índice (sin los términos)"""
+        total = sys.getsizeof(self._terms)
+        for index in (self._by_topping, self._by_cheese, self._by_sauce, self._by_name_token):
+            total += sys.getsizeof(index)
+            total += sum(sys.getsizeof(keys) for keys in index.values())
+        return total + self._by_price.approx_bytes() + self._by_cooking_time.approx_bytes()
+
+    def copy(self) -> 'MenuSearchIndex':
+        """Copia independiente de los índices (los términos se comparten)"""
+        other = MenuSearchIndex()
+        for mine, theirs in (
+            (self._by_topping, other._by_topping),
+            (self._by_cheese, other._by_cheese),
+            (self._by_sauce, other._by_sauce),
+            (self._by_name_token, other._by_name_token),
+        ):
+            for term, keys in mine.items():
+                theirs[term] = set(keys)
+        other._by_price = self._by_price.copy()
+        other._by_cooking_time = self._by_cooking_time.copy()
+        other._terms = dict(self._terms)
+        return other
+
+    def add(self, key: str, pizza: Pizza) -> None:
+        """Indexar un template (reemplaza la entrada previa si existe)"""
+        if key in self._terms:
+            self.remove(key)
+
+        toppings = [normalize_term(t) for t in pizza.toppings]
+        cheese = normalize_term(pizza.cheese)
+        sauce = normalize_term(pizza.sauce)
+        name_tokens = tokenize(pizza.name)
+
+        for topping in toppings:
+            self._by_topping.setdefault(topping, set()).add(key)
+        self._by_cheese.setdefault(cheese, set()).add(key)
+        self._by_sauce.setdefault(sauce, set()).add(key)
+        for token in name_tokens:
+            self._by_name_token.setdefault(token, set()).add(key)
+        self._by_price.add(key, pizza.price)
+        self._by_cooking_time.add(key, pizza.cooking_time)
+
+        self._terms[key] = (toppings, cheese, sauce, name_tokens)
+
+    def remove(self, key: str) -> None:
+        """Eliminar un template de todos los índices"""
+        toppings, cheese, sauce, name_tokens = self._terms.pop(key)
+        for topping in toppings:
+            self._discard(self._by_topping, topping, key)
+        self._discard(self._by_cheese, cheese, key)
+        self._discard(self._by_sauce, sauce, key)
+        for token in name_tokens:
+            self._discard(self._by_name_token, token, key)
+        self._by_price.remove(key)
+        self._by_cooking_time.remove(key)
+
+    def search(
+        self,
+        with_ingredients: Iterable[str] = (),
+        without_ingredients: Iterable[str] = (),
+        max_price: Optional[float] = None,
+        max_cooking_time: Optional[int] = None,
+        query: Optional[str] = None
+    ) -> List[str]:
+        """
+        Buscar claves de templates que cumplan todos los filtros.
+
+        - with_ingredients: todos deben estar en toppings, queso o salsa
+        - without_ingredients: ninguno puede estar presente
+        - query: todos los tokens deben aparecer en el nombre
+
+        Retorna las claves ordenadas por precio (y luego por clave).
+        """
+        postings: List[Set[str]] = []
+        for term in with_ingredients:
+            postings.append(self._ingredient_postings(normalize_term(term)))
+        for token in tokenize(query or ""):
+            postings.append(self._by_name_token.get(token, set()))
+
+        # Los rangos solo se materializan si no hay una lista más pequeña
+        ranges = []
+        if max_price is not None:
+            ranges.append((self._by_price, max_price))
+        if max_cooking_time is not None:
+            ranges.append((self._by_cooking_time, max_cooking_time))
+
+        candidates = self._intersect(postings)
+        for sorted_index, limit in ranges:
+            if candidates is None or len(candidates) > sorted_index.count_at_most(limit):
+                range_keys = sorted_index.keys_at_most(limit)
+                candidates = range_keys if candidates is None else candidates & range_keys
+            else:
+                candidates = {
+                    key for key in candidates
+                    if sorted_index.value_of(key) <= limit
+                }
+            if not candidates:
+                return []
+
+        without = [normalize_term(term) for term in without_ingredients]
+        if candidates is None and not without:
+            return self._by_price.ordered()
+        if candidates is None:
+            candidates = set(self._terms)
+
+        for term in without:
+            if not candidates:
+                break
+            candidates = candidates - self._ingredient_postings(term)
+
+        return self._by_price.ordered(candidates)
+
+    def _ingredient_postings(self, term: str) -> Set[str]:
+        """Unión de las listas de toppings, queso y salsa para un término"""
+        return (
+            self._by_topping.get(term, set())
+            | self._by_cheese.get(term, set())
+            | self._by_sauce.get(term, set())
+        )
+
+    @staticmethod
+    def _intersect(postings: List[Set[str]]) -> Optional[Set[str]]:
+        """Intersectar listas empezando por la más pequeña (None = sin filtro)"""
+        if not postings:
+            return None
+        postings = sorted(postings, key=len)
+        result = set(postings[0])
+        for posting in postings[1:]:
+            if not result:
+                break
+            result &= posting
+        return result
+
+    @staticmethod
+    def _discard(index: Dict[str, Set[str]], term: str, key: str) -> None:
+        keys = index.get(term)
+        if keys is None:
+            return
+        keys.discard(key)
+        if not keys:
+            del index[term]
@@ -8,18 +8,37 @@ SOLID:
 - LSP: Puede sustituir a MenuRepository sin problemas
 """
 
-from typing import Dict, List
-from domain.interfaces import MenuRepository
-from domain.entities import Pizza
+import heapq
+from typing import Any, Callable, Dict, Iterable, List, Optional, Set
+from domain.interfaces import MemoryAccountable, MenuRepository
+from domain.entities import Pizza, PizzaView
 from domain.exceptions import PizzaNotFoundException
 from infrastructure.templates.pizza_templates import PizzaTemplateFactory
+from infrastructure.indexes.menu_search_index import MenuSearchIndex
+from infrastructure.diagnostics.memory import approx_sizeof, prototype_values
 
-class InMemoryMenuRepository(MenuRepository):
+class InMemoryMenuRepository(MenuRepository, MemoryAccountable):
     """Repositorio de menú en memoria"""
     
-    def __init__(self):
+    def __init__(self, initialize: bool = True):
         self._templates: Dict[str, Pizza] = {}
-        self._initialize_menu()
+        self._index = MenuSearchIndex()
+        # Vistas inmutables, creadas una sola vez al registrar
+        self._views: List[PizzaView] = []
+        self._view_positions: Dict[str, int] = {}
+        self._listeners: List[Callable[[str], None]] = []
+        # Bytes aproximados de cada template + su vista, medidos al registrar
+        self._template_bytes: Dict[str, int] = {}
+        # Clave de cada template por su nombre (para template_of)
+        self._keys_by_name: Dict[str, str] = {}
+        # Templates registrados en esta instancia; los heredados de una
+        # instantánea se comparten y los cuenta el repositorio de origen
+        self._owned: Set[str] = set()
+        # Estructuras compartidas con las instantáneas (se copian al
+        # registrar de nuevo en este repositorio: copy-on-write)
+        self._frozen: Optional['InMemoryMenuRepository'] = None
+        if initialize:
+            self._initialize_menu()
     
     def _initialize_menu(self) -> None:
         """Inicializar con templates por defecto"""
@@ -32,7 +51,28 @@ class InMemoryMenuRepository(MenuRepository):
     
     def register(self, name: str, pizza: Pizza) -> None:
         """Registrar un template"""
-        self._templates[name.lower()] = pizza
+        if self._frozen is not None:
+            self._unshare()
+        key = name.lower()
+        previous = self._templates.get(key)
+        if previous is not None and self._keys_by_name.get(previous.name) == key:
+            del self._keys_by_name[previous.name]
+        self._templates[key] = pizza
+        self._keys_by_name[pizza.name] = key
+        self._index.add(key, pizza)
+        
+        view = PizzaView.from_pizza(pizza)
+        if key in self._view_positions:
+            self._views[self._view_positions[key]] = view
+        else:
+            self._view_positions[key] = len(self._views)
+            self._views.append(view)
+        self._template_bytes[key] = (approx_sizeof(pizza)
+                                     + approx_sizeof(view, prototype_values(pizza)))
+        self._owned.add(key)
+        
+        for listener in self._listeners:
+            listener(key)
     
     def get(self, name: str) -> Pizza:
         """Obtener una copia de la pizza"""
@@ -45,4 +85,247 @@ class InMemoryMenuRepository(MenuRepository):
     
     def list_all(self) -> List[Pizza]:
         """Listar todas las pizzas (copias)"""
-        return [template.clone() for template in self._templates.values()]
\ No newline at end of file
+        return [template.clone() for template in self._templates.values()]
+    
+    def template_of(self, pizza: Pizza) -> Optional[Pizza]:
+        """Template del que se copió una pizza (por su nombre), si existe"""
+        key = self._keys_by_name.get(pizza.name)
+        return self._templates.get(key) if key is not None else None
+    
+    def search(
+        self,
+        with_ingredients: Iterable[str] = (),
+        without_ingredients: Iterable[str] = (),
+        max_price: Optional[float] = None,
+        max_cooking_time: Optional[int] = None,
+        query: Optional[str] = None
+    ) -> List[PizzaView]:
+        """Buscar en el índice y retornar las vistas de las que coinciden"""
+        keys = self._index.search(
+            with_ingredients=with_ingredients,
+            without_ingredients=without_ingredients,
+            max_price=max_price,
+            max_cooking_time=max_cooking_time,
+            query=query
+        )
+        return self._views_of(keys)
+    
+    def _views_of(self, keys: Iterable[str]) -> List[PizzaView]:
+        views, positions = self._views, self._view_positions
+        return [views[positions[key]] for key in keys]
+    
+    def get_view(self, name: str) -> PizzaView:
+        """Obtener la vista de solo lectura de una pizza"""
+        name = name.lower()
+        if name not in self._view_positions:
+            raise PizzaNotFoundException(f"Pizza '{name}' no encontrada")
+        return self._views[self._view_positions[name]]
+    
+    def list_views(self, offset: int = 0, limit: Optional[int] = None) -> List[PizzaView]:
+        """Listar vistas de solo lectura (sin clonar)"""
+        end = None if limit is None else offset + limit
+        return self._views[offset:end]
+    
+    def count(self) -> int:
+        """Cantidad de pizzas en el menú"""
+        return len(self._views)
+    
+    def snapshot(self) -> 'MenuRepositoryOverlay':
+        """
+        Menú independiente que comparte los templates, sus vistas y el
+        índice (no los clona ni los copia): registrar en la instantánea
+        no afecta al original y viceversa. Cuesta O(1); solo los
+        templates registrados en ella ocupan memoria propia.
+        Los suscriptores no se copian.
+        """
+        if self._frozen is None:
+            self._frozen = self._shallow_copy()
+        return MenuRepositoryOverlay(self._frozen)
+    
+    def _shallow_copy(self) -> 'InMemoryMenuRepository':
+        """Repositorio de solo lectura sobre las mismas estructuras"""
+        copy = InMemoryMenuRepository(initialize=False)
+        copy._templates = self._templates
+        copy._index = self._index
+        copy._views = self._views
+        copy._view_positions = self._view_positions
+        copy._template_bytes = self._template_bytes
+        copy._keys_by_name = self._keys_by_name
+        return copy
+    
+    def _unshare(self) -> None:
+        """Dejar de compartir las estructuras antes de modificarlas"""
+        self._templates = dict(self._templates)
+        self._index = self._index.copy()
+        self._views = list(self._views)
+        self._view_positions = dict(self._view_positions)
+        self._template_bytes = dict(self._template_bytes)
+        self._keys_by_name = dict(self._keys_by_name)
+        self._frozen = None
+    
+    def memory_usage(self) -> Dict[str, Any]:
+        """
+        Memoria aproximada de templates, vistas e índices.
+        Los templates heredados de otra instantánea se informan aparte
+        (shared_bytes) y no se suman, para no contarlos dos veces.
+        """
+        owned_bytes = 0
+        shared_bytes = 0
+        for key, size in self._template_bytes.items():
+            if key in self._owned:
+                owned_bytes += size
+            else:
+                shared_bytes += size
+        entries = len(self._owned)
+        index_bytes = self._index.approx_bytes()
+        return {
+            'entries': entries,
+            'approx_bytes': owned_bytes + index_bytes,
+            'index_bytes': index_bytes,
+            'shared_bytes': shared_bytes,
+            'shared_entries': len(self._templates) - entries,
+            'entities': {
+                'Pizza': {
+                    'avg_bytes': round(owned_bytes / entries, 1) if entries else 0.0,
+                    'samples': entries
+                }
+            }
+        }
+    
+    def subscribe(self, listener: Callable[[str], None]) -> None:
+        """Suscribirse a los registros (p. ej. para invalidar cachés)"""
+        self._listeners.append(listener)
+
+
+class MenuRepositoryOverlay(MenuRepository, MemoryAccountable):
+    """
+    Instantánea del menú: una capa propia (templates registrados en ella,
+    con su índice) sobre un menú base compartido de solo lectura.
+
+    Las vistas conservan el orden de la base; un template reemplazado
+    ocupa la posición del original y los nuevos van al final.
+    """
+    
+    def __init__(
+        self,
+        base: InMemoryMenuRepository,
+        local: Optional[InMemoryMenuRepository] = None,
+        added: Optional[List[str]] = None
+    ):
+        self._base = base
+        self._local = local if local is not None else InMemoryMenuRepository(initialize=False)
+        # Claves propias que no existen en la base (en orden de registro)
+        self._added: List[str] = added if added is not None else []
+        self._listeners: List[Callable[[str], None]] = []
+    
+    def register(self, name: str, pizza: Pizza) -> None:
+        """Registrar un template solo en esta instantánea"""
+        key = name.lower()
+        if key not in self._local._templates and key not in self._base._templates:
+            self._added.append(key)
+        self._local.register(key, pizza)
+        
+        for listener in self._listeners:
+            listener(key)
+    
+    def get(self, name: str) -> Pizza:
+        """Obtener una copia de la pizza"""
+        return self._layer_of(name.lower()).get(name)
+    
+    def list_all(self) -> List[Pizza]:
+        """Listar todas las pizzas (copias)"""
+        return [self.get(key) for key in self._keys()]
+    
+    def template_of(self, pizza: Pizza) -> Optional[Pizza]:
+        """Template del que se copió una pizza (primero los propios)"""
+        return self._local.template_of(pizza) or self._base.template_of(pizza)
+    
+    def search(
+        self,
+        with_ingredients: Iterable[str] = (),
+        without_ingredients: Iterable[str] = (),
+        max_price: Optional[float] = None,
+        max_cooking_time: Optional[int] = None,
+        query: Optional[str] = None
+    ) -> List[PizzaView]:
+        """Buscar en ambas capas y mezclar por (precio, clave)"""
+        filters = dict(
+            with_ingredients=list(with_ingredients),
+            without_ingredients=list(without_ingredients),
+            max_price=max_price,
+            max_cooking_time=max_cooking_time,
+            query=query
+        )
+        if not self._local._templates:
+            return self._base.search(**filters)
+        
+        local_templates = self._local._templates
+        base_keys = [
+            key for key in self._base._index.search(**filters)
+            if key not in local_templates
+        ]
+        local_keys = self._local._index.search(**filters)
+        base_views = zip(base_keys, self._base._views_of(base_keys))
+        local_views = zip(local_keys, self._local._views_of(local_keys))
+        merged = heapq.merge(
+            base_views, local_views,
+            key=lambda item: (item[1].price, item[0])
+        )
+        return [view for _, view in merged]
+    
+    def get_view(self, name: str) -> PizzaView:
+        """Obtener la vista de solo lectura de una pizza"""
+        return self._layer_of(name.lower()).get_view(name)
+    
+    def list_views(self, offset: int = 0, limit: Optional[int] = None) -> List[PizzaView]:
+        """Listar vistas de solo lectura (sin clonar)"""
+        base_count = self._base.count()
+        end = self.count() if limit is None else min(offset + limit, self.count())
+        views = self._base.list_views(offset, max(0, min(end, base_count) - offset))
+        if self._local._templates and views:
+            # Reemplazar los templates que esta instantánea redefine
+            positions = self._base._view_positions
+            for key in self._local._templates:
+                position = positions.get(key)
+                if position is not None and offset <= position < offset + len(views):
+                    views[position - offset] = self._local.get_view(key)
+        for position in range(max(offset, base_count), end):
+            views.append(self._local.get_view(self._added[position - base_count]))
+        return views
+    
+    def count(self) -> int:
+        """Cantidad de pizzas en el menú"""
+        return self._base.count() + len(self._added)
+    
+    def snapshot(self) -> 'MenuRepositoryOverlay':
+        """Otra instantánea sobre la misma base (copia la capa propia)"""
+        local = self._local._shallow_copy()
+        local._unshare()
+        return MenuRepositoryOverlay(self._base, local, list(self._added))
+    
+    def memory_usage(self) -> Dict[str, Any]:
+        """
+        Memoria de la capa propia. La base compartida se informa aparte
+        (shared_bytes, sin los templates reemplazados) y no se suma.
+        """
+        usage = self._local.memory_usage()
+        local_templates = self._local._templates
+        shared = [
+            size for key, size in self._base._template_bytes.items()
+            if key not in local_templates
+        ]
+        return dict(
+            usage,
+            shared_bytes=usage['shared_bytes'] + sum(shared),
+            shared_entries=usage['shared_entries'] + len(shared)
+        )
+    
+    def subscribe(self, listener: Callable[[str], None]) -> None:
+        """Suscribirse a los registros (p. ej. para invalidar cachés)"""
+        self._listeners.append(listener)
+    
+    def _layer_of(self, key: str) -> InMemoryMenuRepository:
+        return self._local if key in self._local._templates else self._base
+    
+    def _keys(self) -> List[str]:
+        return list(self._base._templates) + self._added
@@ -7,20 +7,39 @@ SOLID:
 - DIP: Implementa la interfaz OrderRepository
 """
 
-from typing import Dict, List, Optional
-from domain.interfaces import OrderRepository
-from domain.entities import Order
+import sys
+from typing import Any, Callable, Dict, Iterator, List, Optional
+from domain.interfaces import MemoryAccountable, OrderRepository
+from domain.entities import Order, Pizza
 from domain.exceptions import OrderNotFoundException
+from infrastructure.diagnostics.memory import SizeSampler
 
-class InMemoryOrderRepository(OrderRepository):
+class InMemoryOrderRepository(OrderRepository, MemoryAccountable):
     """Repositorio de pedidos en memoria"""
     
-    def __init__(self):
+    def __init__(self, template_of: Optional[Callable[[Pizza], Optional[Pizza]]] = None):
+        """
+        template_of: template del que se copió cada pizza (p. ej.
+        MenuRepository.template_of); los valores que comparte con él no
+        se cuentan en el tamaño de los pedidos.
+        """
+        self._template_of = template_of
         self._orders: Dict[str, Order] = {}
+        # Pedidos en orden de llegada (solo se agregan): iter_all los
+        # recorre por posición, sin copiar, aunque se guarden más
+        self._log: List[Order] = []
+        # Tamaño promedio por muestreo al guardar (no al consultar)
+        self._order_sizes = SizeSampler()
+        self._pizza_sizes = SizeSampler()
     
     def save(self, order: Order) -> None:
         """Guardar un pedido"""
+        if self._orders.get(order.order_id) is not order:
+            self._log.append(order)
         self._orders[order.order_id] = order
+        template = self._template_of(order.pizza) if self._template_of else None
+        self._order_sizes.observe(order, template)
+        self._pizza_sizes.observe(order.pizza, template)
     
     def get_by_id(self, order_id: str) -> Optional[Order]:
         """Obtener pedido por ID"""
@@ -30,4 +49,33 @@ class InMemoryOrderRepository(OrderRepository):
     
     def get_all(self) -> List[Order]:
         """Obtener todos los pedidos"""
-        return list(self._orders.values())
\ No newline at end of file
+        return list(self._orders.values())
+    
+    def iter_all(self) -> Iterator[Order]:
+        """
+        Recorrer los pedidos existentes al empezar, sin copiarlos.
+        Los pedidos guardados durante el recorrido no se incluyen y los
+        reemplazados (mismo ID) se omiten en su posición anterior.
+        """
+        return self._iter_log(len(self._log))
+    
+    def _iter_log(self, end: int) -> Iterator[Order]:
+        orders = self._orders
+        log = self._log
+        for position in range(end):
+            order = log[position]
+            if orders.get(order.order_id) is order:
+                yield order
+    
+    def memory_usage(self) -> Dict[str, Any]:
+        """Memoria aproximada: promedio muestreado x cantidad de pedidos"""
+        entries = len(self._orders)
+        return {
+            'entries': entries,
+            'approx_bytes': (int(self._order_sizes.average * entries)
+                             + sys.getsizeof(self._orders) + sys.getsizeof(self._log)),
+            'entities': {
+                'Order': self._order_sizes.summary(),
+                'Pizza': self._pizza_sizes.summary()
+            }
+        }
\ No newline at end of file
@@ -0,0 +1,65 @@
+# infrastructure/sharding/consistent_hash.py
+"""
+Anillo de hashing consistente.
+
+Asigna cada clave (p. ej. un store_id) a un nodo (p. ej. un proceso
+worker). Con nodos virtuales la carga se reparte de forma uniforme y al
+agregar o quitar un nodo solo se mueven ~1/N de las claves.
+
+SOLID:
+- SRP: Solo decide qué nodo es dueño de cada clave
+"""
+
+import hashlib
+from bisect import bisect_right
+from typing import Dict, Iterable, List
+
+class ConsistentHashRing:
+    """Anillo de hashing consistente con nodos virtuales"""
+    
+    def __init__(self, nodes: Iterable[str] = (), virtual_nodes: int = 100):
+        if virtual_nodes <= 0:
+            raise ValueError("virtual_nodes debe ser mayor que 0")
+        self._virtual_nodes = virtual_nodes
+        self._hashes: List[int] = []
+        self._owners: Dict[int, str] = {}
+        self._nodes: List[str] = []
+        for node in nodes:
+            self.add_node(node)
+    
+    @property
+    def nodes(self) -> List[str]:
+        return list(self._nodes)
+    
+    def add_node(self, node: str) -> None:
+        """Agregar un nodo con sus réplicas virtuales"""
+        if node in self._nodes:
+            return
+        self._nodes.append(node)
+        for replica in range(self._virtual_nodes):
+            point = self._hash(f"{node}#{replica}")
+            self._owners[point] = node
+        self._hashes = sorted(self._owners)
+    
+    def remove_node(self, node: str) -> None:
+        """Quitar un nodo (sus claves pasan al siguiente en el anillo)"""
+        if node not in self._nodes:
+            return
+        self._nodes.remove(node)
+        for replica in range(self._virtual_nodes):
+            self._owners.pop(self._hash(f"{node}#{replica}"), None)
+        self._hashes = sorted(self._owners)
+    
+    def node_for(self, key: str) -> str:
+        """Nodo dueño de una clave"""
+        if not self._hashes:
+            raise LookupError("El anillo no tiene nodos")
+        position = bisect_right(self._hashes, self._hash(key))
+        if position == len(self._hashes):
+            position = 0
+        return self._owners[self._hashes[position]]
+    
+    @staticmethod
+    def _hash(value: str) -> int:
+        digest = hashlib.blake2b(value.encode(), digest_size=8).digest()
+        return int.from_bytes(digest, 'big')
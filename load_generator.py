@@ -0,0 +1,558 @@
+"""
+Generador de carga local para la API.
+
+Ejecuta una mezcla configurable de peticiones (leer menu, crear pedido,
+leer pedido) contra la app de create_app y reporta throughput y
+latencias p50/p90/p99/p999 en JSON, mas histogramas estilo HDR.
+Todo corre offline contra localhost.
+
+Destinos:
+- wsgi:   la app en el mismo proceso, sin red (cliente de pruebas WSGI)
+- server: lanza un servidor local en un subproceso y lo ataca por HTTP
+- --url:  un servidor ya levantado en localhost (p. ej. python run.py)
+
+Modelos de llegada:
+- closed: cada worker envia la siguiente peticion al recibir la respuesta
+- open:   llegadas de Poisson a --rate peticiones/s; la latencia se mide
+          desde el instante programado (incluye la espera en cola)
+
+Uso:
+    python load_generator.py --concurrency 8 --duration 10
+    python load_generator.py --target server --arrival open --rate 500
+    python load_generator.py --mix menu=70,create=20,read=10 --json out.json --hgrm out.hgrm
+"""
+
+import argparse
+import http.client
+import json
+import math
+import random
+import socket
+import subprocess
+import sys
+import threading
+import time
+from typing import Any, Callable, Dict, Iterable, List, Optional, Tuple
+from urllib.parse import urlsplit
+
+LOCAL_HOSTS = ("localhost", "127.0.0.1", "::1")
+PIZZAS = ["margarita", "pepperoni", "hawaiana", "4quesos"]
+SIZES = [None, "small", "medium", "large"]
+EXTRAS = ["queso extra", "champiñones", "aceitunas", "cebolla", "tocino"]
+OPERATIONS = ("menu", "create", "read")
+# IDs de pedidos que se guardan para 'read' (muestra de tamaño fijo)
+MAX_ORDER_IDS = 1024
+
+# (status, cuerpo JSON o None)
+Response = Tuple[int, Optional[Dict[str, Any]]]
+
+
+class LatencyHistogram:
+    """
+    Histograma log-lineal estilo HDR de latencias en microsegundos.
+
+    Cada potencia de 2 se divide en 2**sub_bucket_bits sub-buckets, con
+    un error relativo acotado (< 1% con 7 bits) y memoria constante sin
+    importar cuantas muestras se registren.
+    """
+
+    def __init__(self, sub_bucket_bits: int = 7):
+        self._sub_bucket_bits = sub_bucket_bits
+        self._counts: Dict[int, int] = {}
+        self.total_count = 0
+        self.min = 0
+        self.max = 0
+        self._sum = 0
+
+    def record(self, value_us: int) -> None:
+        value_us = max(0, int(value_us))
+        bucket = self._bucket_of(value_us)
+        self._counts[bucket] = self._counts.get(bucket, 0) + 1
+        if self.total_count == 0 or value_us < self.min:
+            self.min = value_us
+        if value_us > self.max:
+            self.max = value_us
+        self.total_count += 1
+        self._sum += value_us
+
+    def merge(self, other: 'LatencyHistogram') -> None:
+        for bucket, count in other._counts.items():
+            self._counts[bucket] = self._counts.get(bucket, 0) + count
+        if other.total_count:
+            if self.total_count == 0 or other.min < self.min:
+                self.min = other.min
+            self.max = max(self.max, other.max)
+        self.total_count += other.total_count
+        self._sum += other._sum
+
+    @property
+    def mean(self) -> float:
+        return self._sum / self.total_count if self.total_count else 0.0
+
+    def value_at_percentile(self, percentile: float) -> int:
+        """Valor (limite superior del bucket) bajo el que cae el percentil"""
+        if self.total_count == 0:
+            return 0
+        target = max(1, math.ceil(self.total_count * percentile / 100.0))
+        target = min(target, self.total_count)
+        seen = 0
+        for bucket in sorted(self._counts):
+            seen += self._counts[bucket]
+            if seen >= target:
+                return min(self._bucket_upper(bucket), self.max)
+        return self.max
+
+    def summary(self) -> Dict[str, float]:
+        return {
+            'min': self.min,
+            'p50': self.value_at_percentile(50),
+            'p90': self.value_at_percentile(90),
+            'p99': self.value_at_percentile(99),
+            'p999': self.value_at_percentile(99.9),
+            'max': self.max,
+            'mean': round(self.mean, 1)
+        }
+
+    def percentile_distribution(self, ticks_per_half_distance: int = 5) -> str:
+        """Distribucion de percentiles en formato .hgrm (HdrHistogram)"""
+        lines = [f"{'Value':>12} {'Percentile':>14} {'TotalCount':>10} {'1/(1-Percentile)':>14}", ""]
+        if self.total_count == 0:
+            return "\n".join(lines) + "\n"
+
+        buckets = sorted(self._counts)
+        cumulative = []
+        seen = 0
+        for bucket in buckets:
+            seen += self._counts[bucket]
+            cumulative.append((self._bucket_upper(bucket), seen))
+
+        percentile = 0.0
+        position = 0
+        while True:
+            target = max(1, int(self.total_count * percentile / 100.0 + 0.5))
+            while cumulative[position][1] < target:
+                position += 1
+            value, count = cumulative[position]
+            value = min(value, self.max)
+            inverse = "" if percentile >= 100 else f"{1 / (1 - percentile / 100):14.2f}"
+            lines.append(f"{value / 1000:12.3f} {percentile / 100:14.12f} {count:10d} {inverse}")
+            if percentile >= 100 or count >= self.total_count:
+                break
+            # Igual que HdrHistogram: pasos mas finos al acercarse a 100
+            half_distance = 100.0 - percentile
+            step = half_distance / 2 / ticks_per_half_distance
+            percentile = min(100.0, percentile + max(step, 1e-9))
+
+        lines.append(f"#[Mean    = {self.mean / 1000:12.3f}, Max = {self.max / 1000:12.3f}]")
+        lines.append(f"#[Total count    = {self.total_count:12d}]")
+        lines.append("#[Values in milliseconds]")
+        return "\n".join(lines) + "\n"
+
+    def _bucket_of(self, value: int) -> int:
+        shift = value.bit_length() - self._sub_bucket_bits - 1
+        if shift <= 0:
+            return value
+        return (value >> shift) << shift
+
+    def _bucket_upper(self, bucket: int) -> int:
+        shift = bucket.bit_length() - self._sub_bucket_bits - 1
+        if shift <= 0:
+            return bucket
+        return bucket + (1 << shift) - 1
+
+
+# ============================================
+# TRANSPORTES
+# ============================================
+
+class WSGITransport:
+    """Peticiones a la app en el mismo proceso (sin red)"""
+
+    def __init__(self, app):
+        self._client = app.test_client()
+
+    def request(self, method: str, path: str, body: Optional[Dict] = None) -> Response:
+        response = self._client.open(path, method=method, json=body)
+        return response.status_code, response.get_json(silent=True)
+
+    def close(self) -> None:
+        pass
+
+
+class HTTPTransport:
+    """Peticiones HTTP/1.1 con conexion persistente a un servidor local"""
+
+    def __init__(self, host: str, port: int, timeout: float = 10.0):
+        self._host = host
+        self._port = port
+        self._timeout = timeout
+        self._connection: Optional[http.client.HTTPConnection] = None
+
+    def request(self, method: str, path: str, body: Optional[Dict] = None) -> Response:
+        payload = json.dumps(body).encode() if body is not None else None
+        headers = {'Content-Type': 'application/json'} if payload is not None else {}
+        for attempt in (1, 2):
+            if self._connection is None:
+                self._connection = http.client.HTTPConnection(
+                    self._host, self._port, timeout=self._timeout)
+            try:
+                self._connection.request(method, path, body=payload, headers=headers)
+                response = self._connection.getresponse()
+                data = response.read()
+                if response.getheader('Connection', '').lower() == 'close':
+                    self.close()
+                try:
+                    return response.status, json.loads(data) if data else None
+                except ValueError:
+                    return response.status, None
+            except (ConnectionError, http.client.HTTPException, socket.timeout):
+                # El servidor cerro la conexion: reconectar una vez
+                self.close()
+                if attempt == 2:
+                    raise
+        raise RuntimeError("unreachable")
+
+    def close(self) -> None:
+        if self._connection is not None:
+            self._connection.close()
+            self._connection = None
+
+
+def _free_port() -> int:
+    with socket.socket(socket.AF_INET, socket.SOCK_STREAM) as sock:
+        sock.bind(("127.0.0.1", 0))
+        return sock.getsockname()[1]
+
+
+def _wait_for_port(port: int, process: subprocess.Popen, timeout: float = 15.0) -> None:
+    deadline = time.monotonic() + timeout
+    while time.monotonic() < deadline:
+        if process.poll() is not None:
+            raise RuntimeError("El servidor local terminó antes de arrancar")
+        try:
+            with socket.create_connection(("127.0.0.1", port), timeout=0.2):
+                return
+        except OSError:
+            time.sleep(0.05)
+    raise RuntimeError(f"El servidor local no respondió en el puerto {port}")
+
+
+def serve(port: int) -> None:
+    """Levantar la app en localhost con un servidor WSGI multihilo"""
+    from werkzeug.serving import make_server
+    from api.main import create_app
+
+    server = make_server("127.0.0.1", port, create_app(), threaded=True)
+    server.serve_forever()
+
+
+# ============================================
+# GENERADOR DE CARGA
+# ============================================
+
+def parse_mix(spec: str) -> Dict[str, float]:
+    """Parsear 'menu=60,create=30,read=10' a pesos por operacion"""
+    mix = {}
+    for part in spec.split(','):
+        name, _, weight = part.partition('=')
+        name = name.strip()
+        if name not in OPERATIONS:
+            raise ValueError(f"Operación '{name}' no válida (usa {', '.join(OPERATIONS)})")
+        mix[name] = float(weight or 1)
+        if mix[name] < 0:
+            raise ValueError(f"El peso de '{name}' no puede ser negativo")
+    if not any(mix.values()):
+        raise ValueError("La mezcla debe tener al menos un peso positivo")
+    return mix
+
+
+class LoadGenerator:
+    """Ejecuta la mezcla de peticiones y acumula histogramas por operacion"""
+
+    def __init__(
+        self,
+        transport_factory: Callable[[], Any],
+        mix: Dict[str, float],
+        concurrency: int = 8,
+        duration: float = 10.0,
+        arrival: str = "closed",
+        rate: Optional[float] = None,
+        warmup: float = 1.0,
+        seed: int = 1
+    ):
+        if arrival not in ("closed", "open"):
+            raise ValueError("arrival debe ser 'closed' u 'open'")
+        if arrival == "open" and not rate:
+            raise ValueError("El modelo abierto requiere --rate")
+        self._transport_factory = transport_factory
+        self._operations = list(mix)
+        self._weights = [mix[op] for op in self._operations]
+        self._concurrency = concurrency
+        self._duration = duration
+        self._arrival = arrival
+        self._rate = rate
+        self._warmup = warmup
+        self._seed = seed
+        self._order_ids: List[str] = []
+        self._orders_created = 0
+        self._state_lock = threading.Lock()  # _order_ids y _transport_errors
+        self._transport_errors = 0
+        self._schedule_lock = threading.Lock()
+        self._next_arrival = 0.0
+        self._schedule_rng = random.Random(seed)
+        self.histograms: Dict[str, LatencyHistogram] = {}
+
+    def run(self) -> Dict[str, Any]:
+        self._seed_orders()
+        if self._warmup > 0:
+            self._run_phase(self._warmup, record=False)
+        histograms, errors, elapsed = self._run_phase(self._duration, record=True)
+        return self._report(histograms, errors, elapsed)
+
+    def _seed_orders(self) -> None:
+        """Crear algunos pedidos para que 'read' tenga IDs que leer"""
+        transport = self._transport_factory()
+        rng = random.Random(self._seed)
+        try:
+            for _ in range(max(10, self._concurrency)):
+                self._create_order(transport, rng)
+        finally:
+            transport.close()
+
+    def _run_phase(
+        self, duration: float, record: bool
+    ) -> Tuple[Dict[str, LatencyHistogram], Dict[str, int], float]:
+        results: List[Tuple[Dict[str, LatencyHistogram], Dict[str, int]]] = []
+        start = time.perf_counter()
+        deadline = start + duration
+        self._next_arrival = start
+
+        threads = [
+            threading.Thread(
+                target=self._worker,
+                args=(worker_id, deadline, results),
+                daemon=True
+            )
+            for worker_id in range(self._concurrency)
+        ]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        elapsed = time.perf_counter() - start
+
+        histograms = {op: LatencyHistogram() for op in self._operations}
+        errors = {op: 0 for op in self._operations}
+        if record:
+            for worker_histograms, worker_errors in results:
+                for op in self._operations:
+                    histograms[op].merge(worker_histograms[op])
+                    errors[op] += worker_errors[op]
+        return histograms, errors, elapsed
+
+    def _worker(self, worker_id: int, deadline: float, results: List) -> None:
+        # Cada worker tiene su transporte, RNG e histogramas (sin locks)
+        rng = random.Random(self._seed * 1000 + worker_id)
+        transport = None
+        histograms = {op: LatencyHistogram() for op in self._operations}
+        errors = {op: 0 for op in self._operations}
+        try:
+            try:
+                transport = self._transport_factory()
+            except Exception:
+                # Sin transporte (p. ej. servidor caido): el worker no envia nada
+                with self._state_lock:
+                    self._transport_errors += 1
+                return
+            while True:
+                if self._arrival == "open":
+                    intended = self._next_send_time()
+                    if intended >= deadline:
+                        break
+                    delay = intended - time.perf_counter()
+                    if delay > 0:
+                        time.sleep(delay)
+                else:
+                    intended = time.perf_counter()
+                    if intended >= deadline:
+                        break
+
+                op = rng.choices(self._operations, self._weights)[0]
+                try:
+                    ok = self._execute(op, transport, rng)
+                except Exception:
+                    ok = False
+                latency = time.perf_counter() - intended
+                histograms[op].record(latency * 1_000_000)
+                if not ok:
+                    errors[op] += 1
+        finally:
+            if transport is not None:
+                transport.close()
+            results.append((histograms, errors))
+
+    def _next_send_time(self) -> float:
+        """Siguiente llegada de Poisson (compartida por todos los workers)"""
+        with self._schedule_lock:
+            self._next_arrival += self._schedule_rng.expovariate(self._rate)
+            return self._next_arrival
+
+    def _execute(self, op: str, transport, rng: random.Random) -> bool:
+        if op == "menu":
+            status, _ = transport.request("GET", "/menu/")
+            return status == 200
+        if op == "create":
+            return self._create_order(transport, rng)
+        order_id = rng.choice(self._order_ids)
+        status, _ = transport.request("GET", f"/order/{order_id}")
+        return status == 200
+
+    def _create_order(self, transport, rng: random.Random) -> bool:
+        body: Dict[str, Any] = {
+            'pizza': rng.choice(PIZZAS),
+            'customer_name': f"cliente-{rng.randint(1, 10_000)}"
+        }
+        size = rng.choice(SIZES)
+        if size:
+            body['size'] = size
+        if rng.random() < 0.5:
+            body['extra_toppings'] = rng.sample(EXTRAS, rng.randint(1, 2))
+        status, data = transport.request("POST", "/order/", body)
+        if status == 201 and data:
+            self._remember_order(data['order']['order_id'], rng)
+            return True
+        return False
+
+    def _remember_order(self, order_id: str, rng: random.Random) -> None:
+        """Muestreo de reservorio: memoria acotada en ejecuciones largas"""
+        with self._state_lock:
+            self._orders_created += 1
+            if len(self._order_ids) < MAX_ORDER_IDS:
+                self._order_ids.append(order_id)
+                return
+            slot = rng.randrange(self._orders_created)
+            if slot < MAX_ORDER_IDS:
+                self._order_ids[slot] = order_id
+
+    def _report(
+        self,
+        histograms: Dict[str, LatencyHistogram],
+        errors: Dict[str, int],
+        elapsed: float
+    ) -> Dict[str, Any]:
+        total = LatencyHistogram()
+        for histogram in histograms.values():
+            total.merge(histogram)
+        self.histograms = dict(histograms, total=total)
+
+        return {
+            'config': {
+                'concurrency': self._concurrency,
+                'duration_s': self._duration,
+                'arrival': self._arrival,
+                'rate': self._rate,
+                'mix': dict(zip(self._operations, self._weights))
+            },
+            'elapsed_s': round(elapsed, 3),
+            'requests': total.total_count,
+            'errors': sum(errors.values()),
+            'transport_errors': self._transport_errors,
+            'throughput_rps': round(total.total_count / elapsed, 1) if elapsed else 0.0,
+            'latency_us': total.summary(),
+            'operations': {
+                op: {
+                    'requests': histograms[op].total_count,
+                    'errors': errors[op],
+                    'latency_us': histograms[op].summary()
+                }
+                for op in self._operations
+            }
+        }
+
+
+def _local_url(url: str) -> Tuple[str, int]:
+    parts = urlsplit(url)
+    if parts.scheme != "http" or parts.hostname not in LOCAL_HOSTS:
+        raise ValueError("Solo se permiten URLs http:// a localhost")
+    return parts.hostname, parts.port or 80
+
+
+def main(argv: Optional[Iterable[str]] = None) -> int:
+    parser = argparse.ArgumentParser(description="Generador de carga local para la API")
+    parser.add_argument("--target", choices=("wsgi", "server"), default="wsgi",
+                        help="app en proceso (wsgi) o servidor local en un subproceso")
+    parser.add_argument("--url", help="servidor ya levantado en localhost (ignora --target)")
+    parser.add_argument("--concurrency", type=int, default=8)
+    parser.add_argument("--duration", type=float, default=10.0, help="segundos medidos")
+    parser.add_argument("--warmup", type=float, default=1.0, help="segundos sin medir")
+    parser.add_argument("--arrival", choices=("closed", "open"), default="closed")
+    parser.add_argument("--rate", type=float, help="peticiones/s en el modelo abierto")
+    parser.add_argument("--mix", default="menu=60,create=30,read=10")
+    parser.add_argument("--seed", type=int, default=1)
+    parser.add_argument("--json", dest="json_path", help="guardar el reporte JSON")
+    parser.add_argument("--hgrm", dest="hgrm_path",
+                        help="guardar histogramas .hgrm (uno por operacion y total)")
+    parser.add_argument("--serve", type=int, metavar="PORT", help=argparse.SUPPRESS)
+    args = parser.parse_args(argv)
+
+    if args.serve:
+        serve(args.serve)
+        return 0
+
+    try:
+        mix = parse_mix(args.mix)
+        if args.url:
+            host, port = _local_url(args.url)
+    except ValueError as e:
+        parser.error(str(e))
+    if args.arrival == "open" and not args.rate:
+        parser.error("--arrival open requiere --rate")
+
+    process = None
+    if args.url:
+        transport_factory = lambda: HTTPTransport(host, port)
+    elif args.target == "server":
+        port = _free_port()
+        process = subprocess.Popen(
+            [sys.executable, __file__, "--serve", str(port)],
+            stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
+        _wait_for_port(port, process)
+        transport_factory = lambda: HTTPTransport("127.0.0.1", port)
+    else:
+        from api.main import create_app
+        app = create_app()
+        transport_factory = lambda: WSGITransport(app)
+
+    try:
+        generator = LoadGenerator(
+            transport_factory,
+            mix=mix,
+            concurrency=args.concurrency,
+            duration=args.duration,
+            arrival=args.arrival,
+            rate=args.rate,
+            warmup=args.warmup,
+            seed=args.seed
+        )
+        report = generator.run()
+    finally:
+        if process is not None:
+            process.terminate()
+            process.wait()
+
+    output = json.dumps(report, indent=2, ensure_ascii=False)
+    print(output)
+    if args.json_path:
+        with open(args.json_path, "w", encoding="utf-8") as f:
+            f.write(output + "\n")
+    if args.hgrm_path:
+        with open(args.hgrm_path, "w", encoding="utf-8") as f:
+            for name, histogram in generator.histograms.items():
+                f.write(f"# {name}\n")
+                f.write(histogram.percentile_distribution())
+                f.write("\n")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
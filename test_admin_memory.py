@@ -0,0 +1,144 @@
+"""
+Pruebas de GET /admin/memory y del perfilado con tracemalloc.
+"""
+
+import json
+import sys
+import tracemalloc
+import pytest
+from api.main import create_app
+from application.services.diagnostics_service import combine_usage
+from application.services.order_service import OrderService
+from infrastructure.diagnostics.memory import SizeSampler, approx_sizeof, prototype_values
+from infrastructure.repositories.menu_repository import InMemoryMenuRepository
+from infrastructure.repositories.order_repository import InMemoryOrderRepository
+
+ADMIN = {"Authorization": "Bearer token-de-prueba"}
+COMPONENT_KEYS = {"entries", "approx_bytes", "entities"}
+
+
+@pytest.fixture
+def client():
+    client = create_app(stores=["centro"], admin_token="token-de-prueba").test_client()
+    yield client
+    if tracemalloc.is_tracing():
+        tracemalloc.stop()
+
+
+def test_forma_del_reporte(client):
+    client.post("/order/", json={"pizza": "pepperoni", "customer_name": "Ana"})
+    client.post("/store/centro/order/", json={"pizza": "margarita", "customer_name": "Luis"})
+
+    response = client.get("/admin/memory", headers=ADMIN)
+    assert response.status_code == 200
+    memory = response.json["memory"]
+    assert set(memory) == {"process", "approx_bytes", "components", "entities", "tracemalloc"}
+    assert set(memory["components"]) == {"orders", "menu", "prototype_cache", "stores"}
+    for usage in memory["components"].values():
+        assert COMPONENT_KEYS <= set(usage)
+    assert memory["components"]["orders"]["entries"] == 1
+    assert memory["components"]["stores"]["orders"]["entries"] == 1
+    assert memory["entities"]["Order"]["samples"] == 2
+    assert memory["approx_bytes"] == sum(u["approx_bytes"] for u in memory["components"].values())
+    assert memory["tracemalloc"] == {"available": True, "tracing": False}
+
+
+def test_templates_compartidos_se_cuentan_una_vez():
+    menu = InMemoryMenuRepository()
+    snapshot = menu.snapshot()
+    usage = snapshot.memory_usage()
+
+    assert usage["entries"] == 0
+    assert usage["shared_entries"] == 4
+    assert usage["approx_bytes"] == usage["index_bytes"]
+    assert usage["shared_bytes"] == menu.memory_usage()["approx_bytes"] - menu.memory_usage()["index_bytes"]
+
+    snapshot.register("napolitana", menu.get("margarita"))
+    assert snapshot.memory_usage()["entries"] == 1
+
+
+def test_admin_requiere_token():
+    client = create_app(admin_token="token-de-prueba").test_client()
+    assert client.get("/admin/memory").status_code == 401
+    assert client.get("/admin/memory", headers={"Authorization": "Bearer otro"}).status_code == 401
+    assert create_app().test_client().get("/admin/memory", headers=ADMIN).status_code == 403
+
+
+def test_admin_sin_cors(client):
+    origin = {"Origin": "http://otro.example"}
+    admin = client.get("/admin/memory", headers={**ADMIN, **origin})
+    assert "Access-Control-Allow-Origin" not in admin.headers
+    assert "Access-Control-Allow-Origin" in client.get("/menu/", headers=origin).headers
+
+
+@pytest.mark.parametrize("frames", ["0", "65536", "100000", "abc"])
+def test_frames_fuera_de_rango(client, frames):
+    response = client.post(f"/admin/memory/tracemalloc?frames={frames}", headers=ADMIN)
+    assert response.status_code == 400
+    assert not tracemalloc.is_tracing()
+
+
+def test_ciclo_de_tracemalloc(client):
+    assert client.get("/admin/memory/tracemalloc", headers=ADMIN).status_code == 409
+    assert client.post("/admin/memory/tracemalloc?frames=1", headers=ADMIN).status_code == 200
+
+    client.post("/order/", json={"pizza": "pepperoni", "customer_name": "Ana"})
+    response = client.get("/admin/memory/tracemalloc?limit=5", headers=ADMIN)
+    assert response.status_code == 200
+    assert len(response.json["tracemalloc"]["modules"]) <= 5
+    assert client.get("/admin/memory/tracemalloc?limit=0", headers=ADMIN).status_code == 400
+
+    assert client.delete("/admin/memory/tracemalloc", headers=ADMIN).status_code == 200
+    assert not tracemalloc.is_tracing()
+
+
+def test_combine_usage_pondera_por_muestras():
+    combined = combine_usage([
+        {"entries": 1, "approx_bytes": 100, "entities": {"Pizza": {"avg_bytes": 100.0, "samples": 1}}},
+        {"entries": 3, "approx_bytes": 600, "entities": {"Pizza": {"avg_bytes": 200.0, "samples": 3}}},
+    ])
+    assert combined["entries"] == 4
+    assert combined["approx_bytes"] == 700
+    assert combined["entities"]["Pizza"] == {"avg_bytes": 175.0, "samples": 4}
+
+
+def test_size_sampler_y_valores_compartidos():
+    sampler = SizeSampler(sample_every=4, warmup=2)
+    for i in range(10):
+        sampler.observe([i] * 10)
+    assert sampler.summary()["samples"] == 4
+
+    menu = InMemoryMenuRepository()
+    template = menu.template_of(menu.get("margarita"))
+    pizza = template.clone()
+    # Los textos vienen del template: solo cuentan la lista, el id y la fecha
+    shared = prototype_values(template)
+    assert approx_sizeof(pizza, shared) == approx_sizeof(pizza) - sum(
+        sys.getsizeof(value)
+        for value in [pizza.name, pizza.size, pizza.base, pizza.sauce, pizza.cheese,
+                      pizza.price, pizza.cooking_time] + pizza.toppings
+    )
+    # Un texto igual pero que no es el del template sí cuenta
+    pizza.name = "".join(["Marga", "rita"])
+    assert approx_sizeof(pizza, shared) - approx_sizeof(template.clone(), shared) \
+        == sys.getsizeof(pizza.name)
+
+
+def test_customer_name_de_la_peticion_se_cuenta():
+    menu = InMemoryMenuRepository()
+    repo = InMemoryOrderRepository(template_of=menu.template_of)
+    # El dict de la petición sigue vivo mientras se guarda el pedido
+    data = json.loads(json.dumps({"pizza": "pepperoni", "customer_name": "Ana María " * 100}))
+    OrderService(repo).create_order(data["customer_name"], menu.get(data["pizza"]))
+
+    order_bytes = repo.memory_usage()["entities"]["Order"]["avg_bytes"]
+    pizza_bytes = repo.memory_usage()["entities"]["Pizza"]["avg_bytes"]
+    assert order_bytes - pizza_bytes >= sys.getsizeof(data["customer_name"])
+
+
+def test_customer_name_del_endpoint_se_cuenta(client):
+    client.post("/order/", json={"pizza": "pepperoni", "customer_name": "x" * 10_000})
+
+    memory = client.get("/admin/memory", headers=ADMIN).json["memory"]
+    order = memory["components"]["orders"]["entities"]["Order"]
+    assert order["avg_bytes"] > 10_000
@@ -0,0 +1,153 @@
+"""
+Pruebas de la exportación columnar de pedidos.
+"""
+
+import csv
+import io
+from datetime import datetime
+import pytest
+from api.main import create_app
+from application.use_cases.export_orders import ExportOrdersUseCase, MAX_ROW_GROUP_SIZE
+from domain.entities import Order
+from domain.exceptions import InvalidQueryException
+from infrastructure.export.order_exporters import (
+    ColumnarOrderExporter,
+    CSVOrderExporter,
+    available_exporters,
+    read_columnar_orders
+)
+from infrastructure.repositories.menu_repository import InMemoryMenuRepository
+from infrastructure.repositories.order_repository import InMemoryOrderRepository
+
+
+def _order(order_id, customer_name="Ana", extra=()):
+    pizza = InMemoryMenuRepository().get("pepperoni")
+    pizza.toppings.extend(extra)
+    return Order(
+        order_id=order_id,
+        customer_name=customer_name,
+        pizza=pizza,
+        status="preparando",
+        ordered_at=datetime(2026, 3, 1, 12, 30)
+    )
+
+
+def _export(exporter, orders, row_group_size=2):
+    return b"".join(exporter.export(orders, row_group_size))
+
+
+def test_columnar_ida_y_vuelta():
+    orders = [_order(f"o{i}", f"cliente {i}", extra=["piña"] * (i % 3)) for i in range(5)]
+    data = _export(ColumnarOrderExporter(), orders)
+    rows = list(read_columnar_orders(io.BytesIO(data)))
+
+    assert len(rows) == 5
+    for order, row in zip(orders, rows):
+        assert row["order_id"] == order.order_id
+        assert row["customer_name"] == order.customer_name
+        assert row["status"] == "preparando"
+        assert row["ordered_at"] == order.ordered_at
+        assert row["pizza_name"] == "Pepperoni"
+        assert row["toppings"] == order.pizza.toppings
+        assert row["price"] == pytest.approx(order.pizza.price)
+        assert row["cooking_time"] == 15
+
+
+def test_columnar_sin_pedidos():
+    data = _export(ColumnarOrderExporter(), [])
+    assert list(read_columnar_orders(io.BytesIO(data))) == []
+
+
+def test_valores_no_texto_se_exportan_como_texto():
+    orders = [_order("o1", customer_name=123, extra=[7])]
+
+    rows = list(read_columnar_orders(io.BytesIO(_export(ColumnarOrderExporter(), orders))))
+    assert rows[0]["customer_name"] == "123"
+    assert rows[0]["toppings"][-1] == "7"
+
+    text = _export(CSVOrderExporter(), orders).decode("utf-8")
+    row = list(csv.DictReader(io.StringIO(text)))[0]
+    assert row["customer_name"] == "123"
+    assert row["toppings"] == "pepperoni|orégano|7"
+
+
+def test_iter_all_no_copia_ni_incluye_pedidos_nuevos():
+    repo = InMemoryOrderRepository()
+    for i in range(4):
+        repo.save(_order(f"o{i}"))
+    replaced = _order("o1", customer_name="Luis")
+    repo.save(replaced)
+    repo.save(replaced)
+
+    seen = []
+    for order in repo.iter_all():
+        seen.append(order)
+        repo.save(_order(f"nuevo-{len(seen)}"))
+
+    assert [o.order_id for o in seen] == ["o0", "o2", "o3", "o1"]
+    assert seen[-1] is replaced
+    assert len(list(repo.iter_all())) == 8
+
+
+def test_row_group_size_acotado():
+    use_case = ExportOrdersUseCase(InMemoryOrderRepository(), available_exporters())
+    for size in (0, MAX_ROW_GROUP_SIZE + 1):
+        with pytest.raises(InvalidQueryException):
+            use_case.stream("csv", size)
+
+
+ADMIN = {"Authorization": "Bearer token-de-prueba"}
+
+
+@pytest.fixture
+def client():
+    return create_app(stores=["centro"], admin_token="token-de-prueba").test_client()
+
+
+def test_endpoint_export_columnar(client):
+    for name in ("Ana", "Luis", "Eva"):
+        client.post("/order/", json={"pizza": "margarita", "customer_name": name})
+
+    response = client.get("/order/export?format=columnar&row_group_size=2", headers=ADMIN)
+    assert response.status_code == 200
+    rows = list(read_columnar_orders(io.BytesIO(response.data)))
+    assert [row["customer_name"] for row in rows] == ["Ana", "Luis", "Eva"]
+
+
+@pytest.mark.parametrize("query", [
+    "row_group_size=abc",
+    "row_group_size=0",
+    f"row_group_size={10 ** 9}",
+    "format=xlsx",
+])
+def test_endpoint_export_rechaza_parametros_no_validos(client, query):
+    response = client.get(f"/order/export?{query}", headers=ADMIN)
+    assert response.status_code == 400
+    assert response.json["success"] is False
+
+
+@pytest.mark.parametrize("path", ["/order/export", "/store/centro/order/export"])
+def test_endpoint_export_requiere_token(client, path):
+    client.post("/order/", json={"pizza": "margarita", "customer_name": "Ana"})
+
+    assert client.get(path).status_code == 401
+    assert client.get(path, headers={"Authorization": "Bearer otro"}).status_code == 401
+    assert client.get(path, headers=ADMIN).status_code == 200
+
+    without_token = create_app(stores=["centro"]).test_client()
+    response = without_token.get(path, headers=ADMIN)
+    assert response.status_code == 403
+    assert b"Ana" not in response.data
+
+
+def test_endpoint_export_sin_cors(client):
+    origin = {"Origin": "http://otro.example"}
+    for path in ("/order/export", "/store/centro/order/export"):
+        response = client.get(path, headers={**ADMIN, **origin})
+        assert "Access-Control-Allow-Origin" not in response.headers
+    assert "Access-Control-Allow-Origin" in client.get("/order/abc", headers=origin).headers
+
+
+def test_pedido_rechaza_customer_name_no_texto(client):
+    response = client.post("/order/", json={"pizza": "margarita", "customer_name": 123})
+    assert response.status_code == 400
@@ -0,0 +1,186 @@
+"""
+Pruebas del generador de carga: histograma, parseo de la mezcla,
+URLs locales y una ejecución corta contra la app en el mismo proceso.
+"""
+
+import random
+import pytest
+import load_generator
+from api.main import create_app
+from load_generator import (
+    LatencyHistogram,
+    LoadGenerator,
+    WSGITransport,
+    _local_url,
+    parse_mix
+)
+
+
+@pytest.mark.parametrize("value", [0, 1, 127, 128, 129, 255, 256, 1000, 12_345, 999_999, 10**9])
+def test_bucket_acota_el_error_relativo(value):
+    histogram = LatencyHistogram(sub_bucket_bits=7)
+    bucket = histogram._bucket_of(value)
+    upper = histogram._bucket_upper(bucket)
+
+    assert bucket <= value <= upper
+    assert upper - bucket <= max(0, value) / 2**7
+
+
+def test_valores_pequenos_tienen_bucket_exacto():
+    histogram = LatencyHistogram(sub_bucket_bits=7)
+    for value in range(256):
+        assert histogram._bucket_of(value) == value
+        assert histogram._bucket_upper(value) == value
+
+
+def test_value_at_percentile():
+    histogram = LatencyHistogram()
+    for value in range(1, 101):
+        histogram.record(value)
+
+    assert histogram.value_at_percentile(50) == 50
+    assert histogram.value_at_percentile(99) == 99
+    assert histogram.value_at_percentile(100) == 100
+    assert histogram.value_at_percentile(0) == 1
+    assert LatencyHistogram().value_at_percentile(50) == 0
+
+
+def test_value_at_percentile_no_supera_el_maximo():
+    histogram = LatencyHistogram()
+    histogram.record(1_000_001)
+
+    assert histogram.value_at_percentile(99.9) == 1_000_001
+
+
+def test_merge_combina_cuentas_y_extremos():
+    first, second = LatencyHistogram(), LatencyHistogram()
+    for value in (10, 20, 30):
+        first.record(value)
+    for value in (5, 500):
+        second.record(value)
+
+    first.merge(second)
+    first.merge(LatencyHistogram())
+
+    assert first.total_count == 5
+    assert first.min == 5
+    assert first.max == 500
+    assert first.mean == pytest.approx(113)
+    assert first.value_at_percentile(100) == 500
+
+    empty = LatencyHistogram()
+    empty.merge(second)
+    assert (empty.min, empty.max, empty.total_count) == (5, 500, 2)
+
+
+def test_parse_mix():
+    assert parse_mix("menu=60,create=30,read=10") == {"menu": 60.0, "create": 30.0, "read": 10.0}
+    assert parse_mix("menu") == {"menu": 1.0}
+
+
+@pytest.mark.parametrize("spec", [
+    "pizza=10",
+    "menu=-1",
+    "menu=0,read=0",
+    "menu=abc",
+    "",
+])
+def test_parse_mix_rechaza_entradas_invalidas(spec):
+    with pytest.raises(ValueError):
+        parse_mix(spec)
+
+
+def test_local_url():
+    assert _local_url("http://localhost:5000") == ("localhost", 5000)
+    assert _local_url("http://127.0.0.1") == ("127.0.0.1", 80)
+    assert _local_url("http://[::1]:8080/") == ("::1", 8080)
+
+
+@pytest.mark.parametrize("url", [
+    "http://example.com:5000",
+    "https://localhost:5000",
+    "http://10.0.0.1",
+    "http://localhost.example.com",
+    "ftp://127.0.0.1",
+])
+def test_local_url_rechaza_urls_no_locales(url):
+    with pytest.raises(ValueError):
+        _local_url(url)
+
+
+def test_run_contra_la_app_wsgi():
+    app = create_app()
+    generator = LoadGenerator(
+        lambda: WSGITransport(app),
+        mix={"menu": 1, "create": 1, "read": 1},
+        concurrency=2,
+        duration=0.2,
+        warmup=0
+    )
+
+    report = generator.run()
+
+    assert set(report) == {
+        'config', 'elapsed_s', 'requests', 'errors', 'transport_errors',
+        'throughput_rps', 'latency_us', 'operations'
+    }
+    assert set(report['operations']) == {"menu", "create", "read"}
+    assert report['requests'] > 0
+    assert report['errors'] == 0
+    assert report['transport_errors'] == 0
+    assert report['requests'] == sum(op['requests'] for op in report['operations'].values())
+    assert set(report['latency_us']) == {'min', 'p50', 'p90', 'p99', 'p999', 'max', 'mean'}
+    assert set(generator.histograms) == {"menu", "create", "read", "total"}
+
+
+def test_run_cuenta_errores():
+    app = create_app()
+
+    class BrokenRead(WSGITransport):
+        def request(self, method, path, body=None):
+            if method == "GET" and path.startswith("/order/"):
+                return 500, None
+            return super().request(method, path, body)
+
+    report = LoadGenerator(
+        lambda: BrokenRead(app),
+        mix={"read": 1},
+        concurrency=1,
+        duration=0.1,
+        warmup=0
+    ).run()
+
+    assert report['requests'] > 0
+    assert report['errors'] == report['requests']
+    assert report['operations']['read']['errors'] == report['requests']
+
+
+def test_worker_sobrevive_a_un_transporte_que_falla():
+    app = create_app()
+    calls = []
+
+    def factory():
+        calls.append(None)
+        # El primero (pedidos semilla) funciona; los de los workers fallan
+        if len(calls) > 1:
+            raise ConnectionError("sin servidor")
+        return WSGITransport(app)
+
+    report = LoadGenerator(factory, mix={"menu": 1}, concurrency=2, duration=0.05, warmup=0).run()
+
+    assert report['requests'] == 0
+    assert report['errors'] == 0
+    assert report['transport_errors'] == 2
+
+
+def test_ids_de_pedidos_acotados(monkeypatch):
+    monkeypatch.setattr(load_generator, "MAX_ORDER_IDS", 8)
+    generator = LoadGenerator(lambda: None, mix={"read": 1})
+    rng = random.Random(0)
+
+    for i in range(1000):
+        generator._remember_order(f"pedido-{i}", rng)
+
+    assert len(generator._order_ids) == 8
+    assert len(set(generator._order_ids)) == 8
+    assert any(int(order_id.split("-")[1]) >= 8 for order_id in generator._order_ids)
@@ -0,0 +1,146 @@
+"""
+Pruebas del índice de búsqueda del menú y de GET /menu/search.
+"""
+
+import pytest
+from api.main import create_app
+from infrastructure.indexes.menu_search_index import MenuSearchIndex
+from infrastructure.repositories.menu_repository import InMemoryMenuRepository
+from infrastructure.templates.pizza_templates import PizzaTemplateFactory
+
+
+@pytest.fixture
+def index():
+    factory = PizzaTemplateFactory()
+    index = MenuSearchIndex()
+    index.add("margarita", factory.create_margarita())
+    index.add("pepperoni", factory.create_pepperoni())
+    index.add("hawaiana", factory.create_hawaiana())
+    index.add("4quesos", factory.create_four_cheese())
+    return index
+
+
+def test_search_sin_filtros_ordena_por_precio(index):
+    assert index.search() == ["margarita", "pepperoni", "hawaiana", "4quesos"]
+
+
+def test_search_con_ingredientes_incluye_queso_y_salsa(index):
+    assert index.search(with_ingredients=["Piña"]) == ["hawaiana"]
+    assert index.search(with_ingredients=["mozzarella", "tomate"]) == [
+        "margarita", "pepperoni", "hawaiana"
+    ]
+    assert index.search(with_ingredients=["piña", "pepperoni"]) == []
+
+
+def test_search_sin_ingredientes(index):
+    assert index.search(without_ingredients=["mozzarella"]) == ["4quesos"]
+    assert index.search(
+        with_ingredients=["tomate"], without_ingredients=["jamón", "albahaca"]
+    ) == ["pepperoni", "4quesos"]
+
+
+def test_search_por_rangos(index):
+    assert index.search(max_price=11.0) == ["margarita", "pepperoni"]
+    assert index.search(max_cooking_time=14) == ["margarita", "4quesos"]
+    assert index.search(max_price=12.0, max_cooking_time=14) == ["margarita"]
+    assert index.search(max_price=1.0) == []
+
+
+def test_search_por_nombre(index):
+    assert index.search(query="quesos") == ["4quesos"]
+    assert index.search(query="4 QUESOS", max_price=20) == ["4quesos"]
+    assert index.search(query="calzone") == []
+
+
+def test_search_combinando_filtros(index):
+    assert index.search(
+        with_ingredients=["mozzarella"],
+        without_ingredients=["pepperoni"],
+        max_price=12.0,
+        max_cooking_time=15,
+        query="hawaiana"
+    ) == ["hawaiana"]
+
+
+def test_add_reemplaza_la_entrada_previa(index):
+    pizza = PizzaTemplateFactory().create_margarita()
+    pizza.toppings = ["rúcula"]
+    pizza.price = 20.0
+    index.add("margarita", pizza)
+
+    assert index.search(with_ingredients=["albahaca"]) == []
+    assert index.search(with_ingredients=["rúcula"]) == ["margarita"]
+    assert index.search(max_price=9.0) == []
+    assert len(index) == 4
+
+
+def test_remove_elimina_de_todos_los_indices(index):
+    index.remove("pepperoni")
+
+    assert index.search(with_ingredients=["pepperoni"]) == []
+    assert index.search(query="pepperoni") == []
+    assert index.search(max_price=11.0) == ["margarita"]
+    assert "pepperoni" not in index.search()
+
+
+def test_repositorio_reindexa_al_registrar():
+    repo = InMemoryMenuRepository()
+    pizza = PizzaTemplateFactory().create_pepperoni()
+    pizza.price = 5.0
+    repo.register("pepperoni", pizza)
+
+    results = repo.search(max_price=6.0)
+    assert [p.name for p in results] == ["Pepperoni"]
+    assert results[0] is repo.get_view("pepperoni")
+
+
+@pytest.fixture
+def client():
+    return create_app().test_client()
+
+
+def test_endpoint_search(client):
+    response = client.get("/menu/search?with=tomate,mozzarella&without=jamón&max_price=11")
+    assert response.status_code == 200
+    assert [p["name"] for p in response.json["menu"]] == ["Margarita", "Pepperoni"]
+    assert response.json["total"] == 2
+
+
+def test_endpoint_search_usa_las_vistas_del_menu(client):
+    menu_ids = {p["name"]: p["id"] for p in client.get("/menu/").json["menu"]}
+    first = client.get("/menu/search?with=tomate").json["menu"]
+    second = client.get("/menu/search?with=tomate").json["menu"]
+    assert first == second
+    assert {p["name"]: p["id"] for p in first} == {
+        name: menu_ids[name] for name in ("Margarita", "Pepperoni", "Hawaiana", "4 Quesos")
+    }
+
+
+def test_endpoint_search_pagina_y_proyecta(client):
+    response = client.get("/menu/search?with=mozzarella&fields=name,price&limit=2")
+    assert response.json["menu"] == [
+        {"name": "Margarita", "price": 8.99},
+        {"name": "Pepperoni", "price": 10.99},
+    ]
+    assert response.json["total"] == 3
+    assert response.json["next_cursor"] == "2"
+
+    response = client.get("/menu/search?with=mozzarella&fields=name&limit=2&cursor=2")
+    assert response.json["menu"] == [{"name": "Hawaiana"}]
+    assert response.json["next_cursor"] is None
+
+
+@pytest.mark.parametrize("query", ["fields=secreto", "limit=0", "limit=abc", "cursor=x"])
+def test_endpoint_search_rechaza_paginacion_no_valida(client, query):
+    assert client.get(f"/menu/search?{query}").status_code == 400
+
+
+@pytest.mark.parametrize("value", ["abc", "nan", "inf", "-inf"])
+def test_endpoint_search_rechaza_max_price_no_finito(client, value):
+    response = client.get(f"/menu/search?max_price={value}")
+    assert response.status_code == 400
+    assert response.json["success"] is False
+
+
+def test_endpoint_search_rechaza_max_cooking_time_no_entero(client):
+    assert client.get("/menu/search?max_cooking_time=12.5").status_code == 400
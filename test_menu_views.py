@@ -0,0 +1,89 @@
+"""
+Pruebas de GET /menu: vistas de solo lectura, proyección y paginación.
+"""
+
+import pytest
+from api.main import create_app
+from application.services.pizza_service import PizzaService, MENU_FIELDS
+from domain.exceptions import InvalidQueryException
+from infrastructure.repositories.menu_repository import InMemoryMenuRepository
+
+
+@pytest.fixture
+def service():
+    return PizzaService(InMemoryMenuRepository())
+
+
+def test_pagina_con_next_cursor(service):
+    first = service.get_menu_page(limit=3)
+    assert [p["name"] for p in first["menu"]] == ["Margarita", "Pepperoni", "Hawaiana"]
+    assert first["total"] == 4
+    assert first["next_cursor"] == "3"
+
+    second = service.get_menu_page(limit=3, cursor=first["next_cursor"])
+    assert [p["name"] for p in second["menu"]] == ["4 Quesos"]
+    assert second["next_cursor"] is None
+
+
+def test_sin_limit_devuelve_todo(service):
+    page = service.get_menu_page()
+    assert len(page["menu"]) == 4
+    assert page["next_cursor"] is None
+    assert tuple(page["menu"][0]) == MENU_FIELDS
+
+
+def test_cursor_al_final_devuelve_pagina_vacia(service):
+    page = service.get_menu_page(limit=2, cursor="10")
+    assert page["menu"] == []
+    assert page["next_cursor"] is None
+
+
+def test_fields_proyecta_campos(service):
+    page = service.get_menu_page(fields=["name", "cheese"], limit=1)
+    assert page["menu"] == [{"name": "Margarita", "cheese": "mozzarella"}]
+
+
+@pytest.mark.parametrize("kwargs", [
+    {"fields": ["name", "secreto"]},
+    {"limit": 0},
+    {"cursor": "-1"},
+    {"cursor": "abc"},
+    {"cursor": "²"},
+    {"cursor": "٣"},
+])
+def test_parametros_no_validos(service, kwargs):
+    with pytest.raises(InvalidQueryException):
+        service.get_menu_page(**kwargs)
+
+
+def test_vistas_no_clonan(service):
+    repo = InMemoryMenuRepository()
+    assert repo.get_view("margarita") is repo.list_views()[0]
+    assert repo.get_view("Margarita").toppings == ("tomate fresco", "albahaca")
+
+
+@pytest.fixture
+def client():
+    return create_app().test_client()
+
+
+def test_endpoint_recorre_todas_las_paginas(client):
+    names, cursor = [], None
+    while True:
+        url = "/menu/?limit=1&fields=name" + (f"&cursor={cursor}" if cursor else "")
+        response = client.get(url)
+        assert response.status_code == 200
+        names.extend(p["name"] for p in response.json["menu"])
+        cursor = response.json["next_cursor"]
+        if cursor is None:
+            break
+    assert names == ["Margarita", "Pepperoni", "Hawaiana", "4 Quesos"]
+
+
+@pytest.mark.parametrize("query", [
+    "fields=precio", "limit=abc", "limit=-1", "cursor=x", "cursor=%C2%B2"
+])
+def test_endpoint_rechaza_parametros_no_validos(client, query):
+    response = client.get(f"/menu/?{query}")
+    assert response.status_code == 400
+    assert response.json["success"] is False
@@ -0,0 +1,102 @@
+"""
+Pruebas de la caché de prototipos derivados.
+"""
+
+import pytest
+from api.main import create_app
+from application.services.pizza_service import PizzaService
+from infrastructure.cache.derived_prototype_cache import LRUPrototypeCache
+from infrastructure.repositories.menu_repository import InMemoryMenuRepository
+from infrastructure.templates.pizza_templates import PizzaTemplateFactory
+
+
+def _service(max_size=256):
+    repo = InMemoryMenuRepository()
+    cache = LRUPrototypeCache(max_size=max_size)
+    repo.subscribe(cache.invalidate)
+    return repo, cache, PizzaService(repo, cache)
+
+
+def _repriced_pepperoni(price):
+    pizza = PizzaTemplateFactory().create_pepperoni()
+    pizza.price = price
+    return pizza
+
+
+def test_hit_devuelve_copias_independientes():
+    _, cache, service = _service()
+    first = service.get_customized_pizza("pepperoni", "large", ["aceitunas"])
+    second = service.get_customized_pizza("pepperoni", "large", ["aceitunas"])
+
+    assert cache.stats()["hits"] == 1
+    assert second.price == pytest.approx(first.price)
+    assert second.toppings == first.toppings
+    assert second.id != first.id
+    second.toppings.append("anchoas")
+    third = service.get_customized_pizza("pepperoni", "large", ["aceitunas"])
+    assert third.toppings == ["pepperoni", "orégano", "aceitunas"]
+
+
+def test_register_invalida_los_derivados():
+    repo, cache, service = _service()
+    service.get_customized_pizza("pepperoni", "large", None)
+    service.get_customized_pizza("margarita", "large", None)
+
+    repo.register("Pepperoni", _repriced_pepperoni(20.0))
+
+    assert cache.stats()["size"] == 1
+    assert service.get_customized_pizza("pepperoni", "large", None).price == pytest.approx(30.0)
+    assert cache.stats()["invalidations"] == 1
+
+
+def test_put_obsoleto_se_descarta():
+    class RacingMenuRepository(InMemoryMenuRepository):
+        """Reemplaza el template justo después de que se lea (carrera)"""
+
+        def get(self, name):
+            pizza = super().get(name)
+            if pizza.price != 99.0:
+                self.register(name, _repriced_pepperoni(99.0))
+            return pizza
+
+    repo = RacingMenuRepository()
+    cache = LRUPrototypeCache()
+    repo.subscribe(cache.invalidate)
+    service = PizzaService(repo, cache)
+
+    stale = service.get_customized_pizza("pepperoni", "large", None)
+    assert stale.price == pytest.approx(10.99 * 1.5)
+    assert cache.stats()["stale_puts"] == 1
+    assert cache.stats()["size"] == 0
+    assert service.get_customized_pizza("pepperoni", "large", None).price == pytest.approx(99.0 * 1.5)
+
+
+def test_lru_expulsa_el_menos_usado():
+    _, cache, service = _service(max_size=2)
+    service.get_customized_pizza("pepperoni", "large", None)
+    service.get_customized_pizza("margarita", "large", None)
+    service.get_customized_pizza("pepperoni", "large", None)
+    service.get_customized_pizza("hawaiana", "large", None)
+
+    stats = cache.stats()
+    assert stats["size"] == 2
+    assert stats["evictions"] == 1
+    assert cache.get(("margarita", "large", ())) is None
+    assert cache.get(("pepperoni", "large", ())) is not None
+
+
+@pytest.fixture
+def client():
+    return create_app().test_client()
+
+
+@pytest.mark.parametrize("payload", [
+    {"extra_toppings": [{"a": 1}]},
+    {"extra_toppings": [7]},
+    {"extra_toppings": "queso"},
+    {"size": ["large"]},
+])
+def test_pedido_rechaza_personalizacion_no_valida(client, payload):
+    response = client.post("/order/", json={"pizza": "pepperoni", "customer_name": "Ana", **payload})
+    assert response.status_code == 400
+    assert response.json["success"] is False
@@ -0,0 +1,194 @@
+"""
+Pruebas de las rutas por tienda: creación, reparto entre workers y
+menú copy-on-write.
+"""
+
+import pytest
+from api.main import create_app
+from application.services.store_service import StoreService
+from domain.exceptions import (
+    PizzaNotFoundException,
+    StoreLimitException,
+    StoreNotFoundException
+)
+from infrastructure.repositories.menu_repository import InMemoryMenuRepository
+from infrastructure.repositories.order_repository import InMemoryOrderRepository
+from infrastructure.sharding.consistent_hash import ConsistentHashRing
+
+ADMIN = {"Authorization": "Bearer token-de-prueba"}
+
+NAPOLITANA = {
+    "name": "Napolitana",
+    "toppings": ["anchoas", "alcaparras"],
+    "price": 12.5,
+    "cooking_time": 13
+}
+
+
+@pytest.fixture
+def client():
+    return create_app(stores=["centro", "norte"], admin_token="token-de-prueba").test_client()
+
+
+def test_tienda_configurada_tiene_menu_y_pedidos_propios(client):
+    assert client.get("/store/centro/menu/").json["total"] == 4
+
+    response = client.post("/store/centro/order/", json={"pizza": "pepperoni", "customer_name": "Ana"})
+    assert response.status_code == 201
+    order_id = response.json["order"]["order_id"]
+
+    assert client.get(f"/store/centro/order/{order_id}").status_code == 200
+    assert client.get(f"/store/norte/order/{order_id}").status_code == 404
+    assert client.get(f"/order/{order_id}").status_code == 404
+
+
+def test_leer_tienda_desconocida_no_la_crea(client):
+    assert client.get("/store/sur/menu/").status_code == 404
+    assert client.get("/store/sur/menu/").status_code == 404
+
+    assert client.post("/store/sur", headers=ADMIN).status_code == 201
+    assert client.post("/store/sur", headers=ADMIN).status_code == 200
+    assert client.get("/store/sur/menu/").status_code == 200
+
+
+def test_store_id_no_valido(client):
+    assert client.post("/store/no valido!", headers=ADMIN).status_code == 400
+
+
+def test_crear_tiendas_y_templates_requiere_token(client):
+    assert client.post("/store/sur").status_code == 401
+    assert client.put("/store/centro/menu/templates/napolitana", json=NAPOLITANA).status_code == 401
+    assert client.get("/store/sur/menu/").status_code == 404
+
+    disabled = create_app(stores=["centro"]).test_client()
+    assert disabled.post("/store/sur", headers=ADMIN).status_code == 403
+
+
+def test_template_propio_es_copy_on_write(client):
+    response = client.put("/store/centro/menu/templates/napolitana", json=NAPOLITANA, headers=ADMIN)
+    assert response.status_code == 200
+
+    centro = [p["name"] for p in client.get("/store/centro/menu/").json["menu"]]
+    norte = [p["name"] for p in client.get("/store/norte/menu/").json["menu"]]
+    assert "Napolitana" in centro
+    assert "Napolitana" not in norte
+    assert "Napolitana" not in [p["name"] for p in client.get("/menu/").json["menu"]]
+
+    response = client.post("/store/centro/order/", json={
+        "pizza": "napolitana", "customer_name": "Ana", "size": "large"
+    })
+    assert response.status_code == 201
+    assert client.post("/store/norte/order/", json={
+        "pizza": "napolitana", "customer_name": "Ana"
+    }).status_code == 404
+
+
+@pytest.mark.parametrize("body", [
+    {**NAPOLITANA, "price": "gratis"},
+    {**NAPOLITANA, "toppings": [1]},
+    {**NAPOLITANA, "cooking_time": 0},
+    {k: v for k, v in NAPOLITANA.items() if k != "name"},
+])
+def test_template_no_valido(client, body):
+    response = client.put("/store/centro/menu/templates/napolitana", json=body, headers=ADMIN)
+    assert response.status_code == 400
+
+
+def test_template_en_tienda_desconocida(client):
+    response = client.put("/store/sur/menu/templates/napolitana", json=NAPOLITANA, headers=ADMIN)
+    assert response.status_code == 404
+
+
+def test_snapshot_comparte_templates_sin_afectar_al_original():
+    menu = InMemoryMenuRepository()
+    copy = menu.snapshot()
+    assert copy.get_view("margarita") is menu.get_view("margarita")
+
+    pizza = menu.get("pepperoni")
+    pizza.price = 1.0
+    copy.register("pepperoni", pizza)
+    assert copy.get_view("pepperoni").price == 1.0
+    assert menu.get_view("pepperoni").price == 10.99
+    assert menu.search(max_price=1.0) == []
+
+
+def test_snapshot_es_una_capa_sobre_el_menu():
+    menu = InMemoryMenuRepository()
+    copy = menu.snapshot()
+    cheap = menu.get("pepperoni")
+    cheap.price = 1.0
+    copy.register("pepperoni", cheap)
+    napolitana = menu.get("margarita")
+    napolitana.name = "Napolitana"
+    copy.register("napolitana", napolitana)
+
+    # El reemplazo conserva su posición; los nuevos van al final
+    names = [view.name for view in copy.list_views()]
+    assert names == [view.name for view in menu.list_views()] + ["Napolitana"]
+    assert copy.list_views(1, 1)[0].price == 1.0
+    assert [view.name for view in copy.list_views(3, 10)] == ["4 Quesos", "Napolitana"]
+    assert copy.count() == 5
+
+    # La búsqueda mezcla ambas capas por precio
+    prices = [view.price for view in copy.search()]
+    assert prices == sorted(prices) and prices[0] == 1.0
+    assert len(copy.search(query="pepperoni")) == 1
+    assert copy.search(query="napolitana")[0].name == "Napolitana"
+
+    # Registrar en el original no cambia las instantáneas ya creadas
+    menu.register("calzone", menu.get("margarita"))
+    assert menu.count() == 5 and copy.count() == 5
+    with pytest.raises(PizzaNotFoundException):
+        copy.get("calzone")
+
+
+def test_snapshot_no_copia_el_menu():
+    menu = InMemoryMenuRepository()
+    for i in range(200):
+        menu.register(f"pizza {i}", menu.get("margarita"))
+    copy = menu.snapshot()
+    copy.register("napolitana", menu.get("margarita"))
+
+    usage = copy.memory_usage()
+    assert usage["entries"] == 1
+    assert usage["shared_entries"] == 204
+    assert usage["index_bytes"] < menu.memory_usage()["index_bytes"] / 10
+
+
+def test_421_para_tiendas_de_otro_worker():
+    workers = ["worker-a", "worker-b"]
+    ring = ConsistentHashRing(workers)
+    store_ids = [f"tienda-{i}" for i in range(20)]
+    apps = {
+        w: create_app(workers=workers, worker_id=w, stores=store_ids, admin_token="token-de-prueba").test_client()
+        for w in workers
+    }
+
+    for store_id in store_ids:
+        owner = ring.node_for(store_id)
+        other = "worker-b" if owner == "worker-a" else "worker-a"
+        assert apps[owner].get(f"/store/{store_id}/menu/").status_code == 200
+        response = apps[other].get(f"/store/{store_id}/menu/")
+        assert response.status_code == 421
+        assert response.json["worker"] == owner
+        assert apps[other].post(f"/store/{store_id}", headers=ADMIN).status_code == 421
+
+
+@pytest.mark.parametrize("worker_id", [None, "worker-c"])
+def test_worker_id_debe_estar_en_workers(worker_id):
+    with pytest.raises(ValueError):
+        create_app(workers=["worker-a", "worker-b"], worker_id=worker_id)
+
+
+def test_limite_de_tiendas():
+    stores = StoreService(
+        shared_menu=InMemoryMenuRepository(),
+        order_repository_factory=InMemoryOrderRepository,
+        max_stores=2,
+        store_ids=["a", "b"]
+    )
+    with pytest.raises(StoreNotFoundException):
+        stores.get("c")
+    with pytest.raises(StoreLimitException):
+        stores.create("c")
+    assert stores.store_count() == 2